@@ -5,6 +5,69 @@ Contains all predefined CAN message definitions for PCAN receiver
 Add new message definitions here following the same structure.
 """
 
+import sys
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+
+# FC 08 date/time stamps count seconds from this base
+EPOCH_2016 = 1451606400  # Unix timestamp for 2016-01-01 00:00:00 UTC
+
+
+# ==================== STATUS FORMATTERS ====================
+
+# Indexed by (val >= 0) + (val > 0): 0 = overdue, 1 = due today, 2 = due later
+_DUE_STATUS_TEMPLATES = ('OVERDUE by {} days', 'DUE TODAY', 'Due in {} days')
+
+
+def days_from_due_status(val):
+    """Status text for a signed 'days from due' value (FC 78)"""
+    return _DUE_STATUS_TEMPLATES[(val >= 0) + (val > 0)].format(abs(val))
+
+
+# ==================== FC 08 DATE/TIME MESSAGES ====================
+# Every node broadcasts FC 08 with the same layout; only the node ID in the
+# CAN ID (0x1008XY00, XY = node) and the origin note differ. The layout and
+# decoder dicts are shared by reference between all FC 08 entries.
+
+_DATETIME_DATA_DESCRIPTION = {
+    0: 'Date/Time Stamp (Bits 0-7)',
+    1: 'Date/Time Stamp (Bits 8-15)',
+    2: 'Date/Time Stamp (Bits 16-23)',
+    3: 'Date/Time Stamp (Bits 24-31)',
+    4: 'Reserved/Unused',
+}
+
+_DATETIME_SPECIAL_DECODE = {
+    'timestamp': {
+        'type': '32bit',
+        'bytes': [0, 1, 2, 3],  # Data 1-4
+        'endian': 'little',
+        'description': 'Seconds since 2016-01-01 00:00:00',
+        'epoch_base': EPOCH_2016
+    }
+}
+
+
+def _make_datetime_message(node_id, source, origin):
+    """Build the FC 08 Current Date/Time definition sent by one node"""
+    return {
+        'description': f'FC 08: Current Date/Time from {source} (Node 0x{node_id:02X})',
+        'id': 0x10080000 | (node_id << 8),  # Extended ID: 0x1008XY00, XY=node
+        'extended': True,
+        'data_pattern': None,  # Match ANY data from this ID
+        'data_description': _DATETIME_DATA_DESCRIPTION,
+        'special_decode': _DATETIME_SPECIAL_DECODE,
+        'notes': [
+            f'Origin: {origin}',
+            'Timestamp: Raw seconds since 01/01/2016 @ 00:00:00',
+            'Base epoch: 1451606400 (Unix timestamp for 2016-01-01)',
+        ]
+    }
+
+
 PREDEFINED_MESSAGES = {
     'BI_RESULTS': {
         'description': 'FC 46: BI Results (Biological Indicator Results)',
@@ -70,7 +133,7 @@ PREDEFINED_MESSAGES = {
                 'bytes': [0, 1],  # Data 1-2
                 'endian': 'little',
                 'description': 'Days from Due',
-                'status_func': lambda val: 'OVERDUE by {} days'.format(abs(val)) if val < 0 else ('DUE TODAY' if val == 0 else 'Due in {} days'.format(val))
+                'status_func': days_from_due_status
             }
         },
         'notes': [
@@ -80,117 +143,17 @@ PREDEFINED_MESSAGES = {
         ]
     },
     
-    'CURRENT_DATETIME_CONNECTIVITY': {
-        'description': 'FC 08: Current Date/Time from Connectivity (Node 0x11)',
-        'id': 0x10081100,  # Extended ID: 0x1008XY00, XY=11 (Connectivity Interface - Node 17 decimal)
-        'extended': True,
-        'data_pattern': None,  # Match ANY data from this ID
-        'data_description': {
-            0: 'Date/Time Stamp (Bits 0-7)',
-            1: 'Date/Time Stamp (Bits 8-15)',
-            2: 'Date/Time Stamp (Bits 16-23)',
-            3: 'Date/Time Stamp (Bits 24-31)',
-            4: 'Reserved/Unused',
-        },
-        'special_decode': {
-            'timestamp': {
-                'type': '32bit',
-                'bytes': [0, 1, 2, 3],  # Data 1-4
-                'endian': 'little',
-                'description': 'Seconds since 2016-01-01 00:00:00',
-                'epoch_base': 1451606400  # Unix timestamp for 2016-01-01 00:00:00 UTC
-            }
-        },
-        'notes': [
-            'Origin: Connectivity Interface (Node ID: 0x11 / 17 decimal)',
-            'Timestamp: Raw seconds since 01/01/2016 @ 00:00:00',
-            'Base epoch: 1451606400 (Unix timestamp for 2016-01-01)',
-        ]
-    },
+    'CURRENT_DATETIME_CONNECTIVITY': _make_datetime_message(
+        0x11, 'Connectivity', 'Connectivity Interface (Node ID: 0x11 / 17 decimal)'),
     
-    'CURRENT_DATETIME_DISPLAY': {
-        'description': 'FC 08: Current Date/Time from Display (Node 0x09)',
-        'id': 0x10080900,  # Extended ID: 0x1008XY00, XY=09 (Display)
-        'extended': True,
-        'data_pattern': None,  # Match ANY data from this ID
-        'data_description': {
-            0: 'Date/Time Stamp (Bits 0-7)',
-            1: 'Date/Time Stamp (Bits 8-15)',
-            2: 'Date/Time Stamp (Bits 16-23)',
-            3: 'Date/Time Stamp (Bits 24-31)',
-            4: 'Reserved/Unused',
-        },
-        'special_decode': {
-            'timestamp': {
-                'type': '32bit',
-                'bytes': [0, 1, 2, 3],  # Data 1-4
-                'endian': 'little',
-                'description': 'Seconds since 2016-01-01 00:00:00',
-                'epoch_base': 1451606400  # Unix timestamp for 2016-01-01 00:00:00 UTC
-            }
-        },
-        'notes': [
-            'Origin: Display Interface (Node ID: 0x09)',
-            'Timestamp: Raw seconds since 01/01/2016 @ 00:00:00',
-            'Base epoch: 1451606400 (Unix timestamp for 2016-01-01)',
-        ]
-    },
+    'CURRENT_DATETIME_DISPLAY': _make_datetime_message(
+        0x09, 'Display', 'Display Interface (Node ID: 0x09)'),
     
-    'CURRENT_DATETIME_CONTROL': {
-        'description': 'FC 08: Current Date/Time from Control Board (Node 0x07)',
-        'id': 0x10080700,  # Extended ID: 0x1008XY00, XY=07 (Control Board)
-        'extended': True,
-        'data_pattern': None,  # Match ANY data from this ID
-        'data_description': {
-            0: 'Date/Time Stamp (Bits 0-7)',
-            1: 'Date/Time Stamp (Bits 8-15)',
-            2: 'Date/Time Stamp (Bits 16-23)',
-            3: 'Date/Time Stamp (Bits 24-31)',
-            4: 'Reserved/Unused',
-        },
-        'special_decode': {
-            'timestamp': {
-                'type': '32bit',
-                'bytes': [0, 1, 2, 3],  # Data 1-4
-                'endian': 'little',
-                'description': 'Seconds since 2016-01-01 00:00:00',
-                'epoch_base': 1451606400  # Unix timestamp for 2016-01-01 00:00:00 UTC
-            }
-        },
-        'notes': [
-            'Origin: Control Board (Node ID: 0x07)',
-            'Timestamp: Raw seconds since 01/01/2016 @ 00:00:00',
-            'Base epoch: 1451606400 (Unix timestamp for 2016-01-01)',
-        ]
-    },
+    'CURRENT_DATETIME_CONTROL': _make_datetime_message(
+        0x07, 'Control Board', 'Control Board (Node ID: 0x07)'),
     
-    'CURRENT_DATETIME_SENSOR_CONTROL': {
-        'description': 'FC 08: Current Date/Time from Sensor Control (Node 0x1E)',
-        'id': 0x10081E00,  # Extended ID: 0x1008XY00, XY=1E (Sensor Control)
-        'extended': True,
-        'data_pattern': None,  # Match ANY data from this ID
-        'data_description': {
-            0: 'Date/Time Stamp (Bits 0-7)',
-            1: 'Date/Time Stamp (Bits 8-15)',
-            2: 'Date/Time Stamp (Bits 16-23)',
-            3: 'Date/Time Stamp (Bits 24-31)',
-            4: 'Reserved/Unused',
-        },
-        'special_decode': {
-            'timestamp': {
-                'type': '32bit',
-                'bytes': [0, 1, 2, 3],  # Data 1-4
-                'endian': 'little',
-                'description': 'Seconds since 2016-01-01 00:00:00',
-                'epoch_base': 1451606400  # Unix timestamp for 2016-01-01 00:00:00 UTC
-            }
-        },
-        'notes': [
-            'Origin: Sensor Control (Node ID: 0x1E / 30)',
-            'Timestamp: Raw seconds since 01/01/2016 @ 00:00:00',
-            'Base epoch: 1451606400 (Unix timestamp for 2016-01-01)',
-        ]
-    },
+    'CURRENT_DATETIME_SENSOR_CONTROL': _make_datetime_message(
+        0x1E, 'Sensor Control', 'Sensor Control (Node ID: 0x1E / 30)'),
     
     'PRODUCT_IN_USE': {
         'description': 'FC 99: Product In-Use Status',
@@ -217,30 +180,21 @@ PREDEFINED_MESSAGES = {
         ]
     },
     
-    'DISPLAY_SUCCESS': {
-        'description': 'Display Update Success Message',
+    'DISPLAY_RESULT': {
+        'description': 'Display Update Result Message (Success/Error)',
         'id': 0x114F0900,
         'extended': True,
         'data_pattern': [0xFF, 0x00, 0x81],
         'data_description': {
-            0: 'Status Flag (0xFF = Success)',
+            0: 'Status Flag (0xFF)',
             1: 'Reserved (0x00)',
             2: 'Message Type (0x81)',
         },
-        'notes': ['Indicates successful firmware update completion']
-    },
-    
-    'DISPLAY_ERROR': {
-        'description': 'Display Update Error Message',
-        'id': 0x114F0900,
-        'extended': True,
-        'data_pattern': [0xFF, 0x00, 0x81],
-        'data_description': {
-            0: 'Status Flag (0xFF = Error)',
-            1: 'Reserved (0x00)',
-            2: 'Message Type (0x81)',
-        },
-        'notes': ['Indicates firmware update failure']
+        'notes': [
+            'Reports the result of a display firmware update',
+            'Success and Error were specified with the same payload (FF 00 81);',
+            'the distinguishing byte is not documented, so both are reported as one result',
+        ]
     },
 }
 
@@ -280,6 +234,14 @@ DECODER TYPES AVAILABLE:
 - 'nibble_lower': Lower 4 bits of a byte
 - 'nibble_upper': Upper 4 bits of a byte
 - 'byte_enum': Single byte with value mapping
+- 'bit_field': Single bit of a byte ('byte' + 'bit')
+
+FRAME DATA:
+- Decoders index the frame data directly: pass msg.data (bytearray) or any
+  bytes/memoryview as-is. Do not convert it with list(msg.data) first;
+  struct-based fields need a buffer and lists are rejected.
+- Lists written in the definitions (data_pattern, bytes, notes) are frozen
+  into tuples at import.
 
 EXAMPLE - Adding a temperature sensor message:
 
@@ -309,4 +271,313 @@ EXAMPLE - Adding a temperature sensor message:
     },
     'notes': ['Temperature in Celsius * 10']
 },
-"""
\ No newline at end of file
+"""
+
+# ==================== READ-ONLY VIEW ====================
+# Lists in the definitions become tuples and the top-level mapping is exposed
+# read-only, so the tables can be shared safely between threads/tasks.
+# Edit the literal above, not PREDEFINED_MESSAGES at runtime.
+
+
+def _freeze(value):
+    """Recursively convert lists to tuples (dicts are kept, their values frozen)"""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _freeze(item) for key, item in value.items()}
+    return value
+
+
+PREDEFINED_MESSAGES = MappingProxyType(_freeze(PREDEFINED_MESSAGES))
+
+# Old message names -> current entry, so existing command lines keep working.
+# Aliases are accepted wherever a name is typed but are not listed or listened to twice.
+MESSAGE_ALIASES = MappingProxyType({
+    'DISPLAY_SUCCESS': 'DISPLAY_RESULT',
+    'DISPLAY_ERROR': 'DISPLAY_RESULT',
+})
+
+# ==================== GENERATED DECODERS ====================
+# PREDEFINED_MESSAGES stays the editable source of truth. Each special_decode
+# definition is compiled once into a flat tuple of DecodeStep records (byte
+# offsets, shifts, masks and hex formats worked out up front), and from that
+# table a straight-line decode(data) -> dict function is generated with those
+# constants baked in, so decoding a frame never walks nested config dicts or
+# dispatches on field types. The receiver and transceiver both get their
+# decoders from decoder_for().
+
+# Decoder type codes: DecodeStep.kind is the index into DECODER_TYPES, so code
+# dispatching on a field compares small ints instead of type strings.
+DECODER_TYPES = ('16bit', '32bit', '16bit_signed', 'nibble_lower', 'nibble_upper', 'byte_enum', 'bit_field')
+(KIND_16BIT, KIND_32BIT, KIND_16BIT_SIGNED, KIND_NIBBLE_LOWER,
+ KIND_NIBBLE_UPPER, KIND_BYTE_ENUM, KIND_BIT_FIELD) = range(len(DECODER_TYPES))
+
+_MULTI_BYTE_SIZES = {KIND_16BIT: 2, KIND_32BIT: 4, KIND_16BIT_SIGNED: 2}
+_SINGLE_BYTE_LAYOUTS = {  # kind -> (shift, mask, hex format)
+    KIND_NIBBLE_LOWER: (0, 0x0F, '0x{:X}'),
+    KIND_NIBBLE_UPPER: (4, 0x0F, '0x{:X}'),
+    KIND_BYTE_ENUM: (0, 0xFF, '0x{:02X}'),
+}
+_S16_STRUCTS = {'little': struct.Struct('<h'), 'big': struct.Struct('>h')}  # Contiguous signed 16-bit reads
+
+
+@dataclass(frozen=True, slots=True)
+class DecodeStep:
+    """One compiled special_decode field"""
+    name: str
+    kind: int
+    guard: int = -1            # Highest byte index read; skipped if the frame is too short
+    lanes: tuple = ()          # (byte index, shift) pairs for multi-byte types
+    byte: int = 0
+    shift: int = 0
+    mask: int = 0xFF
+    hex_fmt: str = ''
+    description: str = ''
+    values: object = None      # Dense enums as a tuple indexed by value, sparse ones as a dict
+    epoch_base: int = None
+    status_func: object = None
+    error: Exception = None    # Bad definition: raised (and warned about) on decode
+
+
+def compile_values(values):
+    """Intern enum labels; a dense {0: .., 1: .., ...} mapping becomes a tuple indexed by value"""
+    if not isinstance(values, dict):
+        return values
+    values = {key: sys.intern(label) if isinstance(label, str) else label for key, label in values.items()}
+    keys = list(values)
+    if all(type(key) is int for key in keys) and sorted(keys) == list(range(len(keys))):
+        return tuple(values[i] for i in range(len(keys)))
+    return values  # Sparse keys: keep the dict
+
+
+def compile_decode_step(field_name, field_info):
+    """Convert one special_decode field into a DecodeStep (None for unknown types)"""
+    try:
+        kind = DECODER_TYPES.index(field_info['type'])
+    except ValueError:
+        return None  # Unknown type: nothing decoded
+    
+    if kind in _MULTI_BYTE_SIZES:
+        byte_indices = field_info['bytes']
+        guard = max(byte_indices, default=-1)
+    else:
+        guard = field_info['byte']
+    
+    try:
+        if kind in _MULTI_BYTE_SIZES:
+            size = _MULTI_BYTE_SIZES[kind]
+            shifts = range(0, 8 * size, 8)
+            if field_info.get('endian', 'little') != 'little':
+                shifts = reversed(shifts)
+            lanes = tuple(zip([byte_indices[i] for i in range(size)], shifts))
+            return DecodeStep(
+                name=field_name, kind=kind, guard=guard, lanes=lanes,
+                hex_fmt=f'0x{{:0{2 * size}X}}',
+                description=field_info['description'],
+                epoch_base=field_info.get('epoch_base') if kind == KIND_32BIT else None,
+                status_func=field_info.get('status_func') if kind == KIND_16BIT_SIGNED else None,
+            )
+        
+        if kind == KIND_BIT_FIELD:
+            return DecodeStep(
+                name=field_name, kind=kind, guard=guard, byte=guard,
+                shift=field_info.get('bit', 0), mask=0x01,
+                description=field_info['description'],
+                values=compile_values(field_info.get('values')),
+            )
+        
+        shift, mask, hex_fmt = _SINGLE_BYTE_LAYOUTS[kind]
+        return DecodeStep(
+            name=field_name, kind=kind, guard=guard, byte=guard, shift=shift, mask=mask,
+            hex_fmt=hex_fmt, description=field_info['description'],
+            values=compile_values(field_info.get('values')),
+        )
+    except Exception as e:
+        return DecodeStep(name=field_name, kind=kind, guard=guard, error=e)
+
+
+def compile_decode_table(special_decode):
+    """Compile a special_decode definition into a tuple of DecodeSteps"""
+    table = []
+    for field_name, field_info in special_decode.items():
+        try:
+            step = compile_decode_step(field_name, field_info)
+        except Exception as e:
+            step = DecodeStep(name=field_name, kind=-1, error=e)
+        if step is not None:
+            table.append(step)
+    return tuple(table)
+
+
+def _is_index(value):
+    return type(value) is int and value >= 0
+
+
+def _const(namespace, name, value):
+    """Source text for a definition value: ints inline, anything else through the namespace"""
+    if type(value) is int:
+        return repr(value)
+    namespace[name] = value
+    return name
+
+
+def contiguous_run(lanes):
+    """(first byte index, byte order) if the lanes read consecutive bytes in order, else None"""
+    indices = [idx for idx, _ in lanes]
+    start = indices[0]
+    if not all(_is_index(idx) for idx in indices) or indices != list(range(start, start + len(indices))):
+        return None
+    shifts = [shift for _, shift in lanes]
+    return start, 'little' if shifts[0] == 0 else 'big'
+
+
+def _step_lines(n, step, namespace):
+    """Source lines decoding one DecodeStep into decoded[_name<n>]"""
+    if step.error is not None:
+        namespace[f'_error{n}'] = step.error
+        return [f'raise _error{n}']
+    
+    namespace[f'_desc{n}'] = step.description
+    kind = step.kind
+    if kind <= KIND_16BIT_SIGNED:
+        run = contiguous_run(step.lanes)
+        if run is None:
+            terms = []
+            for i, (idx, shift) in enumerate(step.lanes):
+                term = f"data[{_const(namespace, f'_byte{n}_{i}', idx)}]"
+                terms.append(f'({term} << {shift})' if shift else term)
+            lines = [f"raw = {' | '.join(terms)}"]
+        elif kind == KIND_16BIT_SIGNED:
+            # Adjacent bytes: one precompiled struct read gives the signed value directly
+            start, byte_order = run
+            namespace[f'_s16_{n}'] = _S16_STRUCTS[byte_order].unpack_from
+            lines = [f"value, = _s16_{n}(data, {start})",
+                     "raw = value & 0xFFFF"]
+        else:
+            # Adjacent bytes: combined by int.from_bytes on a slice of the frame
+            start, byte_order = run
+            lines = [f"raw = int.from_bytes(data[{start}:{start + len(step.lanes)}], '{byte_order}')"]
+        raw_hex = step.hex_fmt.replace('{:', '{raw:')
+        if kind == KIND_16BIT_SIGNED:
+            if run is None:
+                lines.append("value = raw - 0x10000 if raw & 0x8000 else raw")
+            lines.append(f"result = {{'value': value, 'hex': f'{raw_hex}', 'description': _desc{n}}}")
+            if step.status_func is not None:
+                namespace[f'_status{n}'] = step.status_func
+                lines += ["try:",
+                          f"    result['status'] = _status{n}(value)",
+                          "except Exception:",
+                          "    pass"]
+        else:
+            lines.append(f"result = {{'value': raw, 'hex': f'{raw_hex}', 'description': _desc{n}}}")
+            if step.epoch_base is not None:
+                lines += [f"unix_ts = raw + {_const(namespace, f'_epoch{n}', step.epoch_base)}",
+                          "try:",
+                          "    result['datetime'] = datetime.fromtimestamp(unix_ts, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')",
+                          "    result['unix_timestamp'] = unix_ts",
+                          "except (OSError, OverflowError, ValueError):",
+                          "    result['datetime'] = 'Invalid timestamp'",
+                          "    result['unix_timestamp'] = unix_ts"]
+    elif kind == KIND_BIT_FIELD:
+        bit = _const(namespace, f'_bit{n}', step.shift)
+        lines = [f"byte_val = data[{_const(namespace, f'_byte{n}', step.byte)}]",
+                 f"value = (byte_val >> {bit}) & 0x01",
+                 f"result = {{'value': value, 'byte_value': byte_val, 'bit_position': {bit}, 'description': _desc{n}}}"]
+    elif kind == KIND_NIBBLE_LOWER:
+        # The upper nibble comes along for displays that show both halves of the byte
+        value_hex = step.hex_fmt.replace('{:', '{value:')
+        lines = [f"byte_val = data[{_const(namespace, f'_byte{n}', step.byte)}]",
+                 "value = byte_val & 0x0F",
+                 f"result = {{'value': value, 'hex': f'{value_hex}', 'upper_nibble': byte_val >> 4, 'description': _desc{n}}}"]
+    else:
+        expression = f"data[{_const(namespace, f'_byte{n}', step.byte)}]"
+        if step.shift:
+            expression = f'({expression} >> {step.shift})'
+        if step.mask != 0xFF:
+            expression = f'{expression} & 0x{step.mask:02X}'
+        value_hex = step.hex_fmt.replace('{:', '{value:')
+        lines = [f"value = {expression}",
+                 f"result = {{'value': value, 'hex': f'{value_hex}', 'description': _desc{n}}}"]
+    
+    lines.append(f"decoded[_name{n}] = result")  # Stored before the enum lookup, which may fail
+    if kind >= KIND_NIBBLE_LOWER and step.values is not None:
+        namespace[f'_values{n}'] = step.values
+        if isinstance(step.values, tuple):
+            # Plain index for dense enums (masked values are never negative)
+            lines.append(f"result['text'] = _values{n}[value] if value < {len(step.values)} else 'Unknown'")
+        else:
+            lines.append(f"result['text'] = _values{n}.get(value, 'Unknown')")
+    return lines
+
+
+def step_may_raise(step):
+    """
+    True unless the step provably decodes without error once its length guard
+    passes: a valid definition (non-negative int offsets and bit, plain enum
+    table, numeric epoch) only indexes bytes the guard covers. status_func
+    calls have their own try
+    """
+    if step.error is not None or not _is_index(step.guard):
+        return True
+    if step.kind in _MULTI_BYTE_SIZES:
+        return not all(_is_index(idx) for idx, _ in step.lanes) or (
+            step.epoch_base is not None and type(step.epoch_base) not in (int, float))
+    if not _is_index(step.byte) or (step.kind == KIND_BIT_FIELD and not _is_index(step.shift)):
+        return True
+    return step.values is not None and type(step.values) not in (tuple, dict)
+
+
+def _decode_no_fields(data):
+    return {}
+
+
+def generate_decoder(table):
+    """Generate a straight-line decode(data) -> dict function from a DecodeStep table"""
+    if not table:
+        return _decode_no_fields
+    namespace = {'datetime': datetime, 'timezone': timezone}
+    lines = ['def _decode(data):', '    length = len(data)', '    decoded = {}']
+    
+    for n, step in enumerate(table):
+        namespace[f'_name{n}'] = step.name
+        indent = '    '
+        body = _step_lines(n, step, namespace)
+        if _is_index(step.guard):
+            lines.append(f'    if length > {step.guard}:')  # Skipped if the frame is too short
+            indent = '        '
+        elif type(step.guard) is not int:
+            # Odd offset type: compared at decode time, so a bad one fails (and warns) there
+            namespace[f'_guard{n}'] = step.guard
+            body = [f'if length > _guard{n}:'] + [f'    {line}' for line in body]
+        if step_may_raise(step):
+            lines.append(f'{indent}try:')
+            lines.extend(f'{indent}    {line}' for line in body)
+            lines.append(f'{indent}except Exception as e:')
+            lines.append(f'{indent}    print(f"    Warning: Failed to decode {{_name{n}}}: {{e}}")')
+        else:
+            lines.extend(f'{indent}{line}' for line in body)  # Checked definition: no try needed
+    
+    lines.append('    return decoded')
+    exec('\n'.join(lines) + '\n', namespace)
+    return namespace['_decode']
+
+
+_DECODERS = {}  # id(special_decode) -> (special_decode, generated decode function)
+
+
+def decoder_for(special_decode):
+    """
+    Generated decode(data) -> dict function for a special_decode definition, built on first use
+    
+    Args:
+        special_decode: The 'special_decode' dict of a message definition
+    
+    Returns:
+        decode(data) taking frame data as bytes/bytearray/memoryview; fields the
+        DLC is too short for are skipped, bad definitions print a warning per decode
+    """
+    cached = _DECODERS.get(id(special_decode))
+    if cached is None or cached[0] is not special_decode:
+        cached = (special_decode, generate_decoder(compile_decode_table(special_decode)))
+        _DECODERS[id(special_decode)] = cached
+    return cached[1]
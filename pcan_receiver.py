@@ -14,7 +14,7 @@ Install: pip install python-can
 
 import sys
 import time
-from datetime import datetime
+from array import array
 
 try:
     import can
@@ -24,7 +24,7 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from can_messages_config import PREDEFINED_MESSAGES
+    from can_messages_config import PREDEFINED_MESSAGES, MESSAGE_ALIASES, decoder_for
 except ImportError:
     print("ERROR: can_messages_config.py not found!")
     print("Please ensure can_messages_config.py is in the same directory as this script.")
@@ -42,15 +42,72 @@ CONFIG = {
     'quiet_mode': False,
 }
 
+_MSG_TYPE = ("Std", "Ext")  # Indexed by msg.is_extended_id
+
+# Banner/table strings (constant, built once)
+_SEP_EQ = '=' * 80
+_SEP_DASH = '-' * 80
+_SEP_DASH95 = '-' * 95
+_HEADER_MONITOR = f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30}"
+_HEADER_ROW = f"{_HEADER_MONITOR} {'Match':<15}"           # Multi-target table
+_HEADER_ROW_SINGLE = f"{_HEADER_MONITOR} {'Match':<10}"    # Single-target table
+
+
+def build_acceptance_filters(targets):
+    """
+    Build python-can acceptance filters for the monitored IDs
+    
+    Args:
+        targets: Iterable of (can_id, extended); extended=None guesses from the ID (> 0x7FF = 29-bit)
+    
+    Returns:
+        list of filter dicts for can.Bus(can_filters=...) / bus.set_filters()
+    """
+    filters = {}
+    for can_id, extended in targets:
+        if extended is None:
+            extended = can_id > 0x7FF
+        filters[(can_id, extended)] = {
+            'can_id': can_id,
+            'can_mask': 0x1FFFFFFF if extended else 0x7FF,
+            'extended': extended,
+        }
+    return list(filters.values())
+
+
+class WallClockReader(can.BufferedReader):
+    """
+    BufferedReader that stamps each frame with the wall-clock time it was received
+    python-can's PCAN backend reports boot-relative timestamps unless the optional
+    'uptime' package is installed; rows and summaries need epoch times
+    """
+    
+    def on_message_received(self, msg):
+        msg.timestamp = time.time()
+        super().on_message_received(msg)
+
 
 class CANReceiver:
     """CAN message receiver and monitor"""
     
-    def __init__(self, interface, channel, bitrate):
+    # Monitor row: Timestamp, ID, Type, DLC, Data, Match (column widths fixed)
+    _ROW_FMT = "{:<26} 0x{:<10X} {:<6} {:<4} {:<30} {}".format
+    
+    def __init__(self, interface, channel, bitrate, filters=None):
         self.bus = None
+        self._filters = filters     # Acceptance filters from build_acceptance_filters(), None = all IDs
+        self._reader = None         # WallClockReader fed by self._notifier
+        self._notifier = None
+        self._last_sec = None       # Second last formatted by _fmt_ts()
+        self._last_sec_str = ""
+        self._write = sys.stdout.write  # Match details go out as one write per match
         try:
             self.bus = can.Bus(interface=interface, channel=channel, bitrate=bitrate)
             print(f"✓ Connected: {self.bus.channel_info}")
+            if filters:
+                # Frames with other IDs are dropped by the driver and never reach Python
+                self.bus.set_filters(filters)
+                print(f"✓ Acceptance filters: {len(filters)} ID(s)")
         except can.CanError as e:
             print(f"✗ Connection failed: {e}")
             print("\nTroubleshooting:")
@@ -64,137 +121,145 @@ class CANReceiver:
     
     def monitor_all(self, duration=0):
         """Monitor all CAN traffic"""
-        print(f"\n{'='*80}")
+        print("\n" + _SEP_EQ)
         print("CAN BUS MONITOR")
         print(f"Duration: {'Infinite (Ctrl+C to stop)' if duration == 0 else f'{duration}s'}")
-        print(f"{'='*80}\n")
-        print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30}")
-        print(f"{'-'*80}")
+        print(_SEP_EQ + "\n")
+        print(_HEADER_MONITOR)
+        print(_SEP_DASH)
         
-        start_time = time.time()
+        reader = self._start_reader()
+        start_time = time.monotonic()
+        deadline = start_time + duration if duration > 0 else None
         msg_count = 0
         
         try:
             while True:
-                if duration > 0 and (time.time() - start_time) > duration:
+                if deadline is not None and time.monotonic() > deadline:
                     break
                 
-                msg = self.bus.recv(timeout=0.1)
-                if msg is None:
-                    continue
-                
-                msg_count += 1
-                self._print_message(msg)
+                msg = reader.get_message(timeout=0.1)
+                while msg is not None:  # Drain everything already queued
+                    msg_count += 1
+                    self._print_message(msg)
+                    
+                    if deadline is not None and time.monotonic() > deadline:
+                        break  # Busy bus: the queue may never empty, so TIMEOUT= is checked per frame too
+                    msg = reader.get_message(timeout=0)
                 
         except KeyboardInterrupt:
             print(f"\n\n✓ Stopped by user")
         
-        elapsed = time.time() - start_time
-        print(f"\n{'='*80}")
+        elapsed = time.monotonic() - start_time
+        print("\n" + _SEP_EQ)
         print(f"Messages: {msg_count}, Duration: {elapsed:.2f}s")
-        print(f"{'='*80}\n")
+        print(_SEP_EQ + "\n")
     
     def wait_for_messages(self, targets, timeout=0, quiet_mode=False, collect_all=True):
         """Wait for multiple CAN messages"""
         
-        print(f"\n{'='*80}")
+        print("\n" + _SEP_EQ)
         print(f"MONITORING MULTIPLE MESSAGES")
-        print(f"{'='*80}")
+        print(_SEP_EQ)
         print(f"Targets: {len(targets)} | Mode: {'COLLECT ALL' if collect_all else 'STOP AT FIRST'}")
         print(f"Display: {'QUIET' if quiet_mode else 'VERBOSE'} | Timeout: {'∞' if timeout == 0 else f'{timeout}s'}")
-        print(f"{'='*80}\n")
+        print(_SEP_EQ + "\n")
         
         for i, target in enumerate(targets, 1):
             data_str = "ANY" if target['data'] is None else self._format_data_pattern(target['data'])
             print(f"Target {i}: {target.get('name', 'Unknown')}")
             print(f"  ID: 0x{target['id']:X} | Data: {data_str}")
         
-        print(f"\n{'='*80}\n")
+        print(f"\n{_SEP_EQ}\n")
         
         if not quiet_mode:
-            print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30} {'Match':<15}")
-            print(f"{'-'*95}")
+            print(_HEADER_ROW)
+            print(_SEP_DASH95)
         
-        start_time = time.time()
+        start_wall = time.time()    # Summary offset base: same clock as WallClockReader's stamps, taken before reception starts
+        reader = self._start_reader([target['id'] for target in targets])
+        start_time = time.monotonic()
+        deadline = start_time + timeout if timeout > 0 else None
         msg_count = 0
+        total_matches = 0
         header_printed = False
         
-        match_results = {}
+        match_results = {}   # CAN ID (int) -> result; hex text is only formatted for display
+        targets_by_id = {}   # CAN ID -> [target, ...] so each frame only checks targets with its ID
         for target in targets:
-            key = f"0x{target['id']:X}"
-            match_results[key] = {'name': target.get('name', key), 'count': 0, 'matches': []}
+            tid = target['id']
+            match_results[tid] = {'name': target.get('name', f"0x{tid:X}"), 'count': 0, 'ts': array('d')}
+            targets_by_id.setdefault(tid, []).append(target)
+            target['_pattern'] = self._compile_pattern(target['data'])
         
+        done = False  # Set on the first match when not collecting all
         try:
-            while True:
-                if timeout > 0 and (time.time() - start_time) > timeout:
+            while not done:
+                if deadline is not None and time.monotonic() > deadline:
                     break
                 
-                msg = self.bus.recv(timeout=0.1)
-                if msg is None:
-                    continue
-                
-                msg_count += 1
-                
-                matched_target = None
-                for target in targets:
-                    if self._check_match(msg, target['id'], target['data']):
-                        matched_target = target
-                        break
-                
-                if quiet_mode:
-                    if matched_target:
-                        if not header_printed:
-                            print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30} {'Match':<15}")
-                            print(f"{'-'*95}")
-                            header_printed = True
-                        self._print_message_multi(msg, match=True, match_name=matched_target.get('name', ''))
-                else:
-                    match_name = matched_target.get('name', '') if matched_target else None
-                    self._print_message_multi(msg, match=(matched_target is not None), match_name=match_name)
-                
-                if matched_target:
-                    key = f"0x{matched_target['id']:X}"
-                    match_results[key]['count'] += 1
+                msg = reader.get_message(timeout=0.1)
+                while msg is not None:  # Drain everything already queued
+                    msg_count += 1
                     
-                    current_ts = datetime.now()
-                    match_results[key]['matches'].append({
-                        'timestamp': current_ts,
-                        'timestamp_str': current_ts.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                        'message': msg,
-                        'time_from_start': time.time() - start_time
-                    })
+                    matched_target = None
+                    for target in targets_by_id.get(msg.arbitration_id, ()):
+                        if self._check_match_fast(msg, target['_pattern']):
+                            matched_target = target
+                            break
                     
-                    total_matches = sum(r['count'] for r in match_results.values())
-                    self._print_match_details(msg, total_matches, matched_target.get('decode_info'))
+                    if quiet_mode:
+                        if matched_target:
+                            if not header_printed:
+                                print(_HEADER_ROW)
+                                print(_SEP_DASH95)
+                                header_printed = True
+                            self._print_message_multi(msg, match=True, match_name=matched_target.get('name', ''))
+                    else:
+                        match_name = matched_target.get('name', '') if matched_target else None
+                        self._print_message_multi(msg, match=(matched_target is not None), match_name=match_name)
                     
-                    if not collect_all:
-                        break
+                    if matched_target:
+                        result = match_results[matched_target['id']]
+                        result['count'] += 1
+                        
+                        result['ts'].append(msg.timestamp)  # Wall-clock receive time, formatted only for the summary
+                        
+                        total_matches += 1
+                        self._print_match_details(msg, total_matches, matched_target.get('decode_info'))
+                        
+                        if not collect_all:
+                            done = True
+                            break
+                    
+                    if deadline is not None and time.monotonic() > deadline:
+                        break  # Busy bus: the queue may never empty, so TIMEOUT= is checked per frame too
+                    msg = reader.get_message(timeout=0)
                 
         except KeyboardInterrupt:
             print(f"\n\n✓ Stopped by user")
         
-        elapsed = time.time() - start_time
-        total_matches = sum(r['count'] for r in match_results.values())
+        elapsed = time.monotonic() - start_time
         
-        print(f"\n{'='*80}")
+        print("\n" + _SEP_EQ)
         print(f"SUMMARY: {elapsed:.2f}s | Messages: {msg_count} | Matches: {total_matches}")
-        print(f"{'='*80}")
+        print(_SEP_EQ)
         
-        for key, result in match_results.items():
+        for result in match_results.values():
             if result['count'] > 0:
                 print(f"\n{result['name']}: {result['count']} match(es)")
                 if result['count'] <= 5:
-                    for i, m in enumerate(result['matches'], 1):
-                        print(f"  #{i}: {m['timestamp_str']} (+{m['time_from_start']:.2f}s)")
+                    for i, ts in enumerate(result['ts'], 1):
+                        print(f"  #{i}: {self._fmt_ts(ts)} (+{ts - start_wall:.2f}s)")
                 else:
-                    print(f"  First: {result['matches'][0]['timestamp_str']}")
-                    print(f"  Last:  {result['matches'][-1]['timestamp_str']}")
+                    print(f"  First: {self._fmt_ts(result['ts'][0])}")
+                    print(f"  Last:  {self._fmt_ts(result['ts'][-1])}")
         
         no_matches = [r['name'] for r in match_results.values() if r['count'] == 0]
         if no_matches:
             print(f"\nNo matches: {', '.join(no_matches)}")
         
-        print(f"\n{'='*80}\n")
+        print(f"\n{_SEP_EQ}\n")
         return total_matches > 0
     
     def wait_for_message(self, target_id, target_data=None, timeout=0, decode_info=None, collect_all=True, quiet_mode=False):
@@ -202,9 +267,9 @@ class CANReceiver:
         
         data_str = "ANY" if target_data is None else self._format_data_pattern(target_data)
         
-        print(f"\n{'='*80}")
+        print("\n" + _SEP_EQ)
         print(f"MONITORING SINGLE MESSAGE")
-        print(f"{'='*80}")
+        print(_SEP_EQ)
         print(f"ID: 0x{target_id:X} | Data: {data_str}")
         print(f"Mode: {'COLLECT ALL' if collect_all else 'STOP AT FIRST'} | Display: {'QUIET' if quiet_mode else 'VERBOSE'}")
         print(f"Timeout: {'∞' if timeout == 0 else f'{timeout}s'}")
@@ -212,235 +277,173 @@ class CANReceiver:
         if decode_info and 'description' in decode_info:
             print(f"Desc: {decode_info['description']}")
         
-        print(f"{'='*80}\n")
+        print(_SEP_EQ + "\n")
         
         if not quiet_mode:
-            print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30} {'Match':<10}")
-            print(f"{'-'*80}")
+            print(_HEADER_ROW_SINGLE)
+            print(_SEP_DASH)
         
-        start_time = time.time()
+        compiled = self._compile_pattern(target_data)
+        reader = self._start_reader([target_id])
+        start_time = time.monotonic()
+        deadline = start_time + timeout if timeout > 0 else None
         msg_count = 0
         match_count = 0
-        matched_messages = []
         header_printed = False
         
+        done = False  # Set on the first match when not collecting all
         try:
-            while True:
-                if timeout > 0 and (time.time() - start_time) > timeout:
+            while not done:
+                if deadline is not None and time.monotonic() > deadline:
                     break
                 
-                msg = self.bus.recv(timeout=0.1)
-                if msg is None:
-                    continue
-                
-                msg_count += 1
-                is_match = self._check_match(msg, target_id, target_data)
-                
-                if quiet_mode:
-                    if is_match:
-                        if not header_printed:
-                            print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30} {'Match':<10}")
-                            print(f"{'-'*80}")
-                            header_printed = True
-                        self._print_message(msg, match=True)
-                else:
-                    self._print_message(msg, match=is_match)
-                
-                if is_match:
-                    match_count += 1
-                    current_ts = datetime.now()
-                    matched_messages.append({
-                        'timestamp': current_ts,
-                        'timestamp_str': current_ts.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                        'message': msg,
-                        'time_from_start': time.time() - start_time
-                    })
+                msg = reader.get_message(timeout=0.1)
+                while msg is not None:  # Drain everything already queued
+                    msg_count += 1
+                    is_match = msg.arbitration_id == target_id and self._check_match_fast(msg, compiled)
+                    
+                    if quiet_mode:
+                        if is_match:
+                            if not header_printed:
+                                print(_HEADER_ROW_SINGLE)
+                                print(_SEP_DASH)
+                                header_printed = True
+                            self._print_message(msg, match=True)
+                    else:
+                        self._print_message(msg, match=is_match)
                     
-                    self._print_match_details(msg, match_count, decode_info)
+                    if is_match:
+                        match_count += 1
+                        self._print_match_details(msg, match_count, decode_info)
+                        
+                        if not collect_all:
+                            done = True
+                            break
                     
-                    if not collect_all:
-                        break
+                    if deadline is not None and time.monotonic() > deadline:
+                        break  # Busy bus: the queue may never empty, so TIMEOUT= is checked per frame too
+                    msg = reader.get_message(timeout=0)
                 
         except KeyboardInterrupt:
             print(f"\n\n✓ Stopped by user")
         
-        elapsed = time.time() - start_time
-        print(f"\n{'='*80}")
+        elapsed = time.monotonic() - start_time
+        print("\n" + _SEP_EQ)
         print(f"SUMMARY: {elapsed:.2f}s | Messages: {msg_count} | Matches: {match_count}")
-        print(f"{'='*80}\n")
+        print(_SEP_EQ + "\n")
         
         return match_count > 0
     
-    def _decode_special_fields(self, msg, special_decode):
-        """Generic decoder for special fields"""
-        decoded = {}
-        
-        for field_name, field_info in special_decode.items():
-            try:
-                field_type = field_info['type']
-                
-                if field_type == '16bit':
-                    bytes_idx = field_info['bytes']
-                    if len(msg.data) > max(bytes_idx):
-                        if field_info.get('endian', 'little') == 'little':
-                            value = (msg.data[bytes_idx[1]] << 8) | msg.data[bytes_idx[0]]
-                        else:
-                            value = (msg.data[bytes_idx[0]] << 8) | msg.data[bytes_idx[1]]
-                        decoded[field_name] = {
-                            'value': value,
-                            'hex': f'0x{value:04X}',
-                            'description': field_info['description']
-                        }
-                
-                elif field_type == '32bit':
-                    bytes_idx = field_info['bytes']
-                    if len(msg.data) > max(bytes_idx):
-                        if field_info.get('endian', 'little') == 'little':
-                            value = (msg.data[bytes_idx[3]] << 24) | (msg.data[bytes_idx[2]] << 16) | \
-                                    (msg.data[bytes_idx[1]] << 8) | msg.data[bytes_idx[0]]
-                        else:
-                            value = (msg.data[bytes_idx[0]] << 24) | (msg.data[bytes_idx[1]] << 16) | \
-                                    (msg.data[bytes_idx[2]] << 8) | msg.data[bytes_idx[3]]
-                        decoded[field_name] = {
-                            'value': value,
-                            'hex': f'0x{value:08X}',
-                            'description': field_info['description']
-                        }
-                
-                elif field_type == '16bit_signed':
-                    bytes_idx = field_info['bytes']
-                    if len(msg.data) > max(bytes_idx):
-                        if field_info.get('endian', 'little') == 'little':
-                            raw_value = (msg.data[bytes_idx[1]] << 8) | msg.data[bytes_idx[0]]
-                        else:
-                            raw_value = (msg.data[bytes_idx[0]] << 8) | msg.data[bytes_idx[1]]
-                        
-                        value = raw_value if raw_value < 0x8000 else raw_value - 0x10000
-                        decoded[field_name] = {'value': value, 'description': field_info['description']}
-                        
-                        if 'status_func' in field_info:
-                            decoded[field_name]['status'] = field_info['status_func'](value)
-                
-                elif field_type == 'nibble_lower':
-                    byte_idx = field_info['byte']
-                    if len(msg.data) > byte_idx:
-                        lower = msg.data[byte_idx] & 0x0F
-                        upper = (msg.data[byte_idx] >> 4) & 0x0F
-                        decoded[field_name] = {
-                            'value': lower,
-                            'upper_nibble': upper,
-                            'description': field_info['description']
-                        }
-                        if 'values' in field_info:
-                            decoded[field_name]['text'] = field_info['values'].get(lower, 'Unknown')
-                
-                elif field_type == 'byte_enum':
-                    byte_idx = field_info['byte']
-                    if len(msg.data) > byte_idx:
-                        value = msg.data[byte_idx]
-                        decoded[field_name] = {
-                            'value': value,
-                            'hex': f'0x{value:02X}',
-                            'description': field_info['description']
-                        }
-                        if 'values' in field_info:
-                            decoded[field_name]['text'] = field_info['values'].get(value, 'Unknown')
-                
-                elif field_type == 'bit_field':
-                    byte_idx = field_info['byte']
-                    bit_pos = field_info.get('bit', 0)
-                    if len(msg.data) > byte_idx:
-                        byte_val = msg.data[byte_idx]
-                        bit_value = (byte_val >> bit_pos) & 0x01
-                        decoded[field_name] = {
-                            'value': bit_value,
-                            'byte_value': byte_val,
-                            'bit_position': bit_pos,
-                            'description': field_info['description']
-                        }
-                        if 'values' in field_info:
-                            decoded[field_name]['text'] = field_info['values'].get(bit_value, 'Unknown')
-                
-            except Exception as e:
-                print(f"    Warning: Failed to decode {field_name}: {e}")
-                continue
-        
-        return decoded
+    def _start_reader(self, target_ids=None):
+        """
+        Start background reception into a BufferedReader
+        
+        Args:
+            target_ids: CAN IDs to accept, None = all traffic. Filters given to the
+                constructor take precedence (they carry the exact ID type).
+        
+        Returns:
+            WallClockReader to take received messages from
+        """
+        if not target_ids:
+            self.bus.set_filters(None)
+        elif not self._filters:
+            self.bus.set_filters(build_acceptance_filters((tid, None) for tid in target_ids))
+        
+        if self._notifier is None:
+            self._reader = WallClockReader()
+            self._notifier = can.Notifier(self.bus, [self._reader], timeout=0.1)
+        return self._reader
+    
+    def _fmt_ts(self, ts):
+        """Format an epoch timestamp as 'YYYY-MM-DD HH:MM:SS.mmm' (date part cached per second)"""
+        sec = int(ts)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_sec_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        return f"{self._last_sec_str}.{int((ts - sec) * 1000):03d}"
     
     def _print_match_details(self, msg, match_number, decode_info):
-        """Print detailed match information"""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        print(f"\n{'-'*80}")
-        print(f"MATCH #{match_number}")
-        print(f"{'-'*80}")
-        print(f"  Time: {ts}")
-        print(f"  ID:   0x{msg.arbitration_id:X} ({'Ext' if msg.is_extended_id else 'Std'})")
-        print(f"  DLC:  {msg.dlc}")
-        print(f"  Data: {' '.join(f'{b:02X}' for b in msg.data)}")
+        """Print detailed match information (written to stdout in one call)"""
+        ts = self._fmt_ts(msg.timestamp)
+        
+        lines = [
+            "\n" + _SEP_DASH,
+            f"MATCH #{match_number}",
+            _SEP_DASH,
+            f"  Time: {ts}",
+            f"  ID:   0x{msg.arbitration_id:X} ({_MSG_TYPE[msg.is_extended_id]})",
+            f"  DLC:  {msg.dlc}",
+            f"  Data: {msg.data.hex(' ').upper()}",
+        ]
+        add = lines.append
         
         if decode_info and 'data_description' in decode_info and len(msg.data) > 0:
-            print(f"\n  Data Breakdown:")
+            add(f"\n  Data Breakdown:")
             for i, byte_val in enumerate(msg.data):
                 if i in decode_info['data_description']:
-                    print(f"    [{i+1}] 0x{byte_val:02X}: {decode_info['data_description'][i]}")
+                    add(f"    [{i+1}] 0x{byte_val:02X}: {decode_info['data_description'][i]}")
             
             if 'special_decode' in decode_info:
-                decoded = self._decode_special_fields(msg, decode_info['special_decode'])
+                decoded = decoder_for(decode_info['special_decode'])(msg.data)
                 
                 if decoded:
-                    print(f"\n  Decoded Values:")
+                    add(f"\n  Decoded Values:")
                     for field_name, data in decoded.items():
                         desc = data['description']
                         
-                        if 'hex' in data and 'text' in data:
-                            print(f"    {desc}: {data['value']} ({data['hex']}) = {data['text']}")
-                        elif 'hex' in data:
-                            print(f"    {desc}: {data['value']} ({data['hex']})")
-                        elif 'text' in data and 'upper_nibble' in data:
-                            print(f"    {desc}:")
-                            print(f"      Upper: 0x{data['upper_nibble']:X} | Lower: 0x{data['value']:X} = {data['text']}")
+                        if 'upper_nibble' in data:  # nibble_lower: both halves when there's a label
+                            if 'text' in data:
+                                add(f"    {desc}:")
+                                add(f"      Upper: 0x{data['upper_nibble']:X} | Lower: 0x{data['value']:X} = {data['text']}")
+                            else:
+                                add(f"    {desc}: {data['value']}")
                         elif 'status' in data:
-                            print(f"    {desc}: {data['value']} days → {data['status']}")
+                            add(f"    {desc}: {data['value']} days → {data['status']}")
+                        elif 'hex' in data and 'text' in data:
+                            add(f"    {desc}: {data['value']} ({data['hex']}) = {data['text']}")
+                        elif 'hex' in data:
+                            add(f"    {desc}: {data['value']} ({data['hex']})")
                         elif 'bit_position' in data:
-                            print(f"    {desc}:")
-                            print(f"      Byte Value: 0x{data['byte_value']:02X}")
-                            print(f"      Bit {data['bit_position']}: {data['value']} = {data.get('text', data['value'])}")
+                            add(f"    {desc}:")
+                            add(f"      Byte Value: 0x{data['byte_value']:02X}")
+                            add(f"      Bit {data['bit_position']}: {data['value']} = {data.get('text', data['value'])}")
                         else:
-                            print(f"    {desc}: {data['value']}")
+                            add(f"    {desc}: {data['value']}")
         
-        print(f"{'-'*80}\n")
+        add(_SEP_DASH + "\n")
+        self._write('\n'.join(lines) + '\n')
     
-    def _check_match(self, msg, target_id, target_data):
-        """Check if message matches target"""
-        if msg.arbitration_id != target_id:
-            return False
+    def _compile_pattern(self, target_data):
+        """Pack a data pattern into (length, mask, value) ints, None if any data matches"""
         if target_data is None:
-            return True
-        if len(msg.data) != len(target_data):
-            return False
+            return None
+        mask = value = 0
         for i, expected in enumerate(target_data):
-            if expected is not None and (i >= len(msg.data) or msg.data[i] != expected):
-                return False
-        return True
+            if expected is not None:
+                mask |= 0xFF << (8 * i)
+                value |= expected << (8 * i)
+        return len(target_data), mask, value
+    
+    def _check_match_fast(self, msg, compiled):
+        """Check message data against a compiled pattern (ID already matched)"""
+        if compiled is None:
+            return True
+        length, mask, value = compiled
+        data = msg.data
+        return len(data) == length and (int.from_bytes(data, 'little') & mask) == value
     
     def _print_message(self, msg, match=None):
         """Print CAN message"""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        id_str = f"0x{msg.arbitration_id:X}"
-        msg_type = "Ext" if msg.is_extended_id else "Std"
-        data = ' '.join(f'{b:02X}' for b in msg.data) if len(msg.data) > 0 else ""
         match_str = "✓ MATCH" if match else ""
-        print(f"{ts:<26} {id_str:<12} {msg_type:<6} {msg.dlc:<4} {data:<30} {match_str}")
+        print(self._ROW_FMT(self._fmt_ts(msg.timestamp), msg.arbitration_id, _MSG_TYPE[msg.is_extended_id],
+                            msg.dlc, msg.data.hex(' ').upper(), match_str))
     
     def _print_message_multi(self, msg, match=None, match_name=None):
         """Print CAN message with multi-target indicator"""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        id_str = f"0x{msg.arbitration_id:X}"
-        msg_type = "Ext" if msg.is_extended_id else "Std"
-        data = ' '.join(f'{b:02X}' for b in msg.data) if len(msg.data) > 0 else ""
         match_str = f"✓ {match_name}" if (match and match_name) else ("✓ MATCH" if match else "")
-        print(f"{ts:<26} {id_str:<12} {msg_type:<6} {msg.dlc:<4} {data:<30} {match_str}")
+        print(self._ROW_FMT(self._fmt_ts(msg.timestamp), msg.arbitration_id, _MSG_TYPE[msg.is_extended_id],
+                            msg.dlc, msg.data.hex(' ').upper(), match_str))
     
     def _format_data_pattern(self, data_pattern):
         """Format data pattern for display"""
@@ -451,6 +454,9 @@ class CANReceiver:
     
     def close(self):
         """Close CAN bus"""
+        if self._notifier:
+            self._notifier.stop()
+            self._notifier = None
         if self.bus:
             try:
                 self.bus.shutdown()
@@ -487,6 +493,7 @@ def parse_arguments():
             msg_names = arg.split('=', 1)[1].upper()
             for msg_name in msg_names.split(','):
                 msg_name = msg_name.strip()
+                msg_name = MESSAGE_ALIASES.get(msg_name, msg_name)
                 if msg_name in PREDEFINED_MESSAGES:
                     predefined_list.append(msg_name)
                 else:
@@ -512,6 +519,7 @@ def parse_arguments():
                         if byte_val < 0 or byte_val > 255:
                             raise ValueError(f"Byte {byte_val} out of range")
                         target_data.append(byte_val)
+                target_data = tuple(target_data)  # Immutable like config data_pattern; packed to mask/value ints before monitoring
             except ValueError as e:
                 print(f"✗ Invalid DATA: {e}")
                 sys.exit(1)
@@ -529,24 +537,24 @@ def parse_arguments():
 
 def print_predefined_messages():
     """Print predefined messages"""
-    print("\n" + "="*80)
+    print("\n" + _SEP_EQ)
     print("PREDEFINED MESSAGES")
-    print("="*80)
+    print(_SEP_EQ)
     for name, msg_def in PREDEFINED_MESSAGES.items():
         print(f"\n{name}: {msg_def['description']}")
         print(f"  ID: 0x{msg_def['id']:X}")
-    print("\n" + "="*80 + "\n")
+    print(f"\n{_SEP_EQ}\n")
 
 
 def print_usage():
     """Print usage"""
     print("PCAN CAN Receiver")
-    print("="*80)
+    print(_SEP_EQ)
     print("\nUsage:")
     print("  python pcan_receiver.py MSG=BI_RESULTS --quiet")
     print("  python pcan_receiver.py MSG=BI_RESULTS,BI_USAGE --quiet")
     print("  python pcan_receiver.py --list")
-    print("\n" + "="*80)
+    print("\n" + _SEP_EQ)
 
 
 def main():
@@ -559,7 +567,19 @@ def main():
             print_usage()
             sys.exit(1)
         
-        receiver = CANReceiver(CONFIG['interface'], CONFIG['channel'], CONFIG['bitrate'])
+        # Driver-side filtering: only frames with the requested IDs are delivered, so the
+        # summary message counts cover matching IDs only (monitor mode still sees everything)
+        filters = None
+        if not monitor_mode:
+            if predefined_list:
+                filters = build_acceptance_filters(
+                    (PREDEFINED_MESSAGES[name]['id'], PREDEFINED_MESSAGES[name].get('extended', True))
+                    for name in predefined_list
+                )
+            else:
+                filters = build_acceptance_filters([(target_id, None)])
+        
+        receiver = CANReceiver(CONFIG['interface'], CONFIG['channel'], CONFIG['bitrate'], filters)
         
         try:
             if monitor_mode:
@@ -13,6 +13,9 @@ Usage Examples:
     # Send message with interactive data input
     python pcan_sender.py --msg BI_RESULTS --interactive
     
+    # Pick the message interactively too (Tab completes names)
+    python pcan_sender.py --interactive
+    
     # Send FC 08 date/time (current time)
     python pcan_sender.py --msg CURRENT_DATETIME_CONNECTIVITY --now
     
@@ -29,24 +32,39 @@ Install: pip install python-can
 """
 
 import sys
+import time
+import struct
 import argparse
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Try to import python-can
-CAN_AVAILABLE = True
+# Check for python-can without importing it; the import (backend probing)
+# is deferred until a command actually opens a bus
+CAN_AVAILABLE = importlib.util.find_spec('can') is not None
+can = None  # Bound by _lazy_can()
+
+# Line editing and message-name completion for interactive mode (not available
+# everywhere, e.g. Windows without pyreadline3)
 try:
-    import can
+    import readline
 except ImportError:
-    CAN_AVAILABLE = False
-    can = None  # Placeholder
+    readline = None
 
 # Try to import config
 try:
-    from can_messages_config import PREDEFINED_MESSAGES
+    from can_messages_config import PREDEFINED_MESSAGES, MESSAGE_ALIASES
 except ImportError:
     print("WARNING: can_messages_config.py not found!")
     print("Predefined message features will not be available.")
     PREDEFINED_MESSAGES = {}
+    MESSAGE_ALIASES = {}
+
+# The FC 08 date/time messages (one per node), built once instead of scanning names per send
+_FC08_NAMES = frozenset(
+    name for name, cfg in PREDEFINED_MESSAGES.items()
+    if 'CURRENT_DATETIME' in name or 'FC 08' in cfg.get('description', '')
+)
 
 # ==================== CONFIGURATION ====================
 
@@ -58,6 +76,13 @@ CAN_CONFIG = {
 
 # FC 08 Date/Time Configuration
 EPOCH_BASE = 1451606400  # Unix timestamp for 2016-01-01 00:00:00 UTC
+_FC08_STRUCT = struct.Struct('<IB')  # u32 little-endian timestamp + reserved byte
+
+# CAN ID display, keyed by is_extended
+_ID_FMT = {True: '0x{:08X}', False: '0x{:03X}'}
+_ID_TYPE = {True: 'Extended', False: 'Standard'}
+_ID_TYPE_BITS = {True: 'Extended (29-bit)', False: 'Standard (11-bit)'}
+_ID_TYPE_SHORT = {True: 'Ext', False: 'Std'}
 
 # Known Node IDs for reference
 NODE_IDS = {
@@ -67,17 +92,38 @@ NODE_IDS = {
     'SENSOR_CONTROL': 0x1E,    # Node 30 decimal
 }
 
+# Payload separators accepted by parse_data_string, normalised to spaces
+_SEP_TRANS = str.maketrans({',': ' ', '-': ' '})
+
+# Hex token -> byte value for the per-token parser ("a", "0A", "0xff", ...)
+_HEX_TOKENS = {}
+for _value in range(256):
+    for _digits in (f"{_value:x}", f"{_value:X}", f"{_value:02x}", f"{_value:02X}"):
+        for _prefix in ('', '0x', '0X'):
+            _HEX_TOKENS[_prefix + _digits] = _value
+del _value, _digits, _prefix
+
+def _lazy_can():
+    """Import python-can on first use and bind it to the module-level name"""
+    global can
+    if can is None:
+        import can as _can
+        can = _can
+    return can
+
 
 class CANSender:
     """Generic CAN message sender"""
     
-    def __init__(self, interface='pcan', channel='PCAN_USBBUS1', bitrate=250000):
+    def __init__(self, interface='pcan', channel='PCAN_USBBUS1', bitrate=250000, verbose=True):
         """Initialize CAN bus connection"""
+        self.verbose = verbose
         if not CAN_AVAILABLE:
             print("ERROR: python-can module not found!")
             print("Please install it using: pip install python-can")
             sys.exit(1)
         
+        _lazy_can()
         self.bus = None
         try:
             self.bus = can.Bus(interface=interface, channel=channel, bitrate=bitrate)
@@ -95,27 +141,49 @@ class CANSender:
             print(f"✗ Unexpected error: {e}")
             sys.exit(1)
     
-    def __del__(self):
-        """Clean up CAN bus connection"""
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Shut down the CAN bus connection (safe to call more than once)"""
         if self.bus:
             self.bus.shutdown()
+            self.bus = None
     
     def parse_data_string(self, data_str):
         """
-        Parse data string into byte array
+        Parse data string into bytes
         Supports formats: "01 02 03", "01,02,03", "010203", "1 2 3"
         """
         if not data_str:
             return []
         
-        # Remove common separators and whitespace
-        data_str = data_str.replace(',', ' ').replace('-', ' ').strip()
+        # Remove common separators and whitespace (single pass)
+        data_str = data_str.translate(_SEP_TRANS).strip()
+        
+        # Fast path: two-digit hex bytes (optionally 0x-prefixed) in one C call
+        hex_str = data_str
+        if 'x' in hex_str or 'X' in hex_str:
+            hex_str = (' ' + hex_str).replace(' 0x', ' ').replace(' 0X', ' ')
+        try:
+            return bytes.fromhex(hex_str)
+        except ValueError:
+            pass
         
-        # Split and parse
+        # Slow path: mixed-width tokens such as "1 2 3"
         parts = data_str.split()
         data = []
         
         for part in parts:
+            # Every valid 1-2 digit token is a single table lookup
+            byte_val = _HEX_TOKENS.get(part)
+            if byte_val is not None:
+                data.append(byte_val)
+                continue
+            
             try:
                 # Handle hex with or without 0x prefix
                 if part.startswith('0x') or part.startswith('0X'):
@@ -132,24 +200,16 @@ class CANSender:
                 print(f"✗ Error: Invalid byte value '{part}'")
                 return None
         
-        return data
+        return bytes(data)
     
     def build_fc08_data(self, timestamp=None):
         """Build FC 08 date/time data bytes"""
         if timestamp is None:
             # Use current time
-            dt = datetime.now()
-            timestamp = int(dt.timestamp()) - EPOCH_BASE
-        
-        # Convert timestamp to 4 bytes (little-endian)
-        data = []
-        data.append((timestamp >> 0) & 0xFF)   # Byte 0: Bits 0-7
-        data.append((timestamp >> 8) & 0xFF)   # Byte 1: Bits 8-15
-        data.append((timestamp >> 16) & 0xFF)  # Byte 2: Bits 16-23
-        data.append((timestamp >> 24) & 0xFF)  # Byte 3: Bits 24-31
-        data.append(0x00)  # Byte 4: Reserved/Unused
+            timestamp = int(time.time()) - EPOCH_BASE
         
-        return data
+        # Bytes 0-3: timestamp (little-endian), Byte 4: Reserved/Unused
+        return _FC08_STRUCT.pack(timestamp & 0xFFFFFFFF, 0x00)
     
     def send_message(self, can_id, data, is_extended=True, msg_name=None):
         """
@@ -181,32 +241,40 @@ class CANSender:
             
             self.bus.send(msg)
             
-            # Display success message
-            print("=" * 70)
-            if msg_name:
-                print(f"✓ CAN Message SENT: {msg_name}")
-            else:
-                print(f"✓ CAN Message SENT")
-            print("=" * 70)
+            id_format = _ID_FMT[is_extended]
+            data_hex = bytes(data).hex(' ').upper()
             
-            # Display message details
-            id_type = "Extended" if is_extended else "Standard"
-            id_format = "0x{:08X}" if is_extended else "0x{:03X}"
-            print(f"CAN ID:          {id_format.format(can_id)} ({id_type})")
-            print(f"Data:            {' '.join(f'{b:02X}' for b in data) if data else '(empty)'}")
-            print(f"DLC:             {len(data)}")
+            # Quiet mode: one summary line per message
+            if not self.verbose:
+                name_str = f"{msg_name} " if msg_name else ""
+                sys.stdout.write(f"✓ SENT {name_str}{id_format.format(can_id)} [{data_hex}]\n")
+                return True
+            
+            # Display success message
+            id_type = _ID_TYPE[is_extended]
+            lines = [
+                "=" * 70,
+                f"✓ CAN Message SENT: {msg_name}" if msg_name else "✓ CAN Message SENT",
+                "=" * 70,
+                f"CAN ID:          {id_format.format(can_id)} ({id_type})",
+                f"Data:            {data_hex or '(empty)'}",
+                f"DLC:             {len(data)}",
+            ]
             
             # Show additional info for predefined messages
-            if msg_name and msg_name in PREDEFINED_MESSAGES:
-                msg_config = PREDEFINED_MESSAGES[msg_name]
-                print(f"\nMessage Info:")
-                print(f"  Description:   {msg_config.get('description', 'N/A')}")
-                if 'notes' in msg_config and msg_config['notes']:
-                    print(f"  Notes:")
-                    for note in msg_config['notes']:
-                        print(f"    • {note}")
+            msg_config = PREDEFINED_MESSAGES.get(msg_name) if msg_name else None
+            if msg_config:
+                lines.append("\nMessage Info:")
+                lines.append(f"  Description:   {msg_config.get('description', 'N/A')}")
+                notes = msg_config.get('notes')
+                if notes:
+                    lines.append("  Notes:")
+                    lines.extend(f"    • {note}" for note in notes)
+            
+            lines.append("=" * 70)
             
-            print("=" * 70)
+            # One write instead of a print() per line
+            sys.stdout.write("\n".join(lines) + "\n")
             
             return True
             
@@ -224,17 +292,18 @@ class CANSender:
             timestamp: Optional timestamp for FC 08 messages
             use_now: Use current time for FC 08 messages
         """
-        if msg_name not in PREDEFINED_MESSAGES:
+        msg_name = MESSAGE_ALIASES.get(msg_name, msg_name)
+        msg_config = PREDEFINED_MESSAGES.get(msg_name)
+        if msg_config is None:
             print(f"✗ Error: Message '{msg_name}' not found in configuration")
             print(f"  Use --list to see available messages")
             return False
         
-        msg_config = PREDEFINED_MESSAGES[msg_name]
         can_id = msg_config['id']
         is_extended = msg_config.get('extended', True)
         
         # Special handling for FC 08 date/time messages
-        is_fc08 = 'CURRENT_DATETIME' in msg_name or 'FC 08' in msg_config.get('description', '')
+        is_fc08 = msg_name in _FC08_NAMES
         
         if is_fc08 and (use_now or timestamp is not None):
             data = self.build_fc08_data(timestamp)
@@ -256,20 +325,28 @@ class CANSender:
         print("INTERACTIVE MESSAGE BUILDER")
         print("=" * 70)
         
+        # No --msg/--id: ask for a predefined message by name
+        if not msg_name and can_id is None:
+            msg_name = prompt_msg_name()
+            if not msg_name:
+                print("✗ No message name entered")
+                return False
+        
         # Get message info
         if msg_name:
-            if msg_name not in PREDEFINED_MESSAGES:
+            msg_name = MESSAGE_ALIASES.get(msg_name, msg_name)
+            msg_config = PREDEFINED_MESSAGES.get(msg_name)
+            if msg_config is None:
                 print(f"✗ Error: Message '{msg_name}' not found")
                 return False
             
-            msg_config = PREDEFINED_MESSAGES[msg_name]
             can_id = msg_config['id']
             is_extended = msg_config.get('extended', True)
             
             print(f"\nMessage:         {msg_name}")
             print(f"Description:     {msg_config.get('description', 'N/A')}")
-            print(f"CAN ID:          0x{can_id:08X if is_extended else can_id:03X}")
-            print(f"ID Type:         {'Extended (29-bit)' if is_extended else 'Standard (11-bit)'}")
+            print(f"CAN ID:          {_ID_FMT[is_extended].format(can_id)}")
+            print(f"ID Type:         {_ID_TYPE_BITS[is_extended]}")
             
             # Show data byte descriptions
             if 'data_description' in msg_config:
@@ -277,8 +354,8 @@ class CANSender:
                 for byte_idx, desc in msg_config['data_description'].items():
                     print(f"  Byte {byte_idx}: {desc}")
         else:
-            print(f"\nCAN ID:          0x{can_id:08X if is_extended else can_id:03X}")
-            print(f"ID Type:         {'Extended (29-bit)' if is_extended else 'Standard (11-bit)'}")
+            print(f"\nCAN ID:          {_ID_FMT[is_extended].format(can_id)}")
+            print(f"ID Type:         {_ID_TYPE_BITS[is_extended]}")
         
         # Get data from user
         print(f"\nEnter data bytes (0-8 bytes):")
@@ -298,8 +375,8 @@ class CANSender:
         # Confirm
         print(f"\n" + "-" * 70)
         print(f"Ready to send:")
-        print(f"  CAN ID: 0x{can_id:08X if is_extended else can_id:03X}")
-        print(f"  Data:   {' '.join(f'{b:02X}' for b in data) if data else '(empty)'}")
+        print(f"  CAN ID: {_ID_FMT[is_extended].format(can_id)}")
+        print(f"  Data:   {bytes(data).hex(' ').upper() if data else '(empty)'}")
         print(f"  DLC:    {len(data)}")
         
         confirm = input("\nSend this message? [Y/n]: ").strip().lower()
@@ -310,6 +387,46 @@ class CANSender:
         return self.send_message(can_id, data, is_extended, msg_name)
 
 
+_LIST_ROWS = None  # Sorted, pre-formatted --list rows (built on first use)
+
+
+def _msg_name_completer(text, state):
+    """readline completer over predefined message names"""
+    prefix = text.upper()
+    matches = [name for name in sorted(PREDEFINED_MESSAGES) if name.startswith(prefix)]
+    return matches[state] if state < len(matches) else None
+
+
+def prompt_msg_name():
+    """Ask for a predefined message name, Tab-completing it where readline is available"""
+    if readline is None:
+        return input("Message name: ").strip().upper()
+    
+    readline.set_completer(_msg_name_completer)
+    readline.set_completer_delims(' \t')
+    # macOS ships libedit, which takes a different binding syntax
+    readline.parse_and_bind('bind ^I rl_complete' if 'libedit' in (readline.__doc__ or '') else 'tab: complete')
+    try:
+        return input("Message name (Tab to complete): ").strip().upper()
+    finally:
+        readline.set_completer(None)  # Later data prompts don't complete names
+
+
+def _list_rows():
+    """Build the --list rows once; PREDEFINED_MESSAGES is read-only"""
+    global _LIST_ROWS
+    if _LIST_ROWS is None:
+        rows = []
+        for msg_name, msg_config in sorted(PREDEFINED_MESSAGES.items()):
+            is_extended = msg_config.get('extended', True)
+            id_format = _ID_FMT[is_extended].format(msg_config['id'])
+            id_type = _ID_TYPE_SHORT[is_extended]
+            description = msg_config.get('description', 'N/A')
+            rows.append(f"{msg_name:35} {id_format} ({id_type})  {description}")
+        _LIST_ROWS = "\n".join(rows)
+    return _LIST_ROWS
+
+
 def list_predefined_messages():
     """List all predefined messages from config"""
     if not PREDEFINED_MESSAGES:
@@ -320,15 +437,7 @@ def list_predefined_messages():
     print("PREDEFINED MESSAGES")
     print("=" * 70 + "\n")
     
-    for msg_name, msg_config in sorted(PREDEFINED_MESSAGES.items()):
-        can_id = msg_config['id']
-        is_extended = msg_config.get('extended', True)
-        description = msg_config.get('description', 'N/A')
-        
-        id_format = f"0x{can_id:08X}" if is_extended else f"0x{can_id:03X}"
-        id_type = "Ext" if is_extended else "Std"
-        
-        print(f"{msg_name:35} {id_format} ({id_type})  {description}")
+    print(_list_rows())
     
     print("\n" + "=" * 70)
     print(f"Total: {len(PREDEFINED_MESSAGES)} predefined messages")
@@ -336,16 +445,30 @@ def list_predefined_messages():
 
 
 def parse_can_id(id_str):
-    """Parse CAN ID from string (supports hex and decimal)"""
+    """Parse CAN ID from string (supports 0x-hex, decimal and bare hex like 102E0900)"""
+    id_str = id_str.strip()
+    if len(id_str) > 10:  # 29-bit IDs are at most "0x" + 8 hex digits
+        return None
     try:
-        if id_str.startswith('0x') or id_str.startswith('0X'):
-            return int(id_str, 16)
-        else:
-            return int(id_str, 0)  # Auto-detect base
+        return int(id_str, 0)  # Auto-detect base
+    except ValueError:
+        pass
+    try:
+        return int(id_str, 16)
     except ValueError:
         return None
 
 
+def _probe_pcan_channel(channel):
+    """Open and close one PCAN channel; returns (channel, error message or None)"""
+    try:
+        bus = can.Bus(interface='pcan', channel=channel, bitrate=250000)
+        bus.shutdown()
+        return channel, None
+    except Exception as e:
+        return channel, str(e)
+
+
 def diagnose_pcan():
     """Diagnose PCAN connection and list available channels"""
     print("\n" + "=" * 70)
@@ -357,6 +480,7 @@ def diagnose_pcan():
         print("  Install with: pip install python-can")
         return
     
+    _lazy_can()
     print("\n✓ python-can module is installed")
     print(f"  Version: {can.__version__ if hasattr(can, '__version__') else 'unknown'}")
     
@@ -378,14 +502,15 @@ def diagnose_pcan():
     
     found_channels = []
     
-    for channel in channels_to_test:
-        try:
-            bus = can.Bus(interface='pcan', channel=channel, bitrate=250000)
+    # Open/close round-trips are independent, so probe every channel at once
+    with ThreadPoolExecutor(max_workers=len(channels_to_test)) as pool:
+        results = list(pool.map(_probe_pcan_channel, channels_to_test))
+    
+    for channel, error_msg in results:
+        if error_msg is None:
             print(f"✓ {channel:20} - AVAILABLE")
-            bus.shutdown()
             found_channels.append(channel)
-        except Exception as e:
-            error_msg = str(e)
+        else:
             if "initialized" in error_msg.lower() or "not found" in error_msg.lower():
                 print(f"✗ {channel:20} - NOT FOUND")
             else:
@@ -494,6 +619,10 @@ Data Format Options:
     parser.add_argument('--bitrate', type=int, default=250000,
                        help='CAN bitrate (default: 250000)')
     
+    # Output
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Print a one-line summary per sent message')
+    
     args = parser.parse_args()
     
     # Handle --list
@@ -507,42 +636,83 @@ Data Format Options:
         sys.exit(0)
     
     # Validate arguments
-    if not args.msg and not args.id:
+    if not args.msg and not args.id and not args.interactive:
         parser.print_help()
-        print("\n✗ Error: Must specify either --msg or --id (or use --list or --diagnose)")
+        print("\n✗ Error: Must specify either --msg or --id (or use --interactive, --list or --diagnose)")
         sys.exit(1)
     
     # Create sender
-    sender = CANSender(
+    with CANSender(
         interface=CAN_CONFIG['interface'],
         channel=args.channel,
-        bitrate=args.bitrate
-    )
-    
-    # Handle timestamp/datetime conversion for FC 08
-    timestamp = None
-    if args.datetime:
-        try:
-            dt = datetime.strptime(args.datetime, "%Y-%m-%d %H:%M:%S")
-            timestamp = int(dt.timestamp()) - EPOCH_BASE
-            print(f"Converted datetime to timestamp: {timestamp}")
-        except ValueError as e:
-            print(f"✗ Error: Invalid datetime format: {e}")
-            print("  Use format: YYYY-MM-DD HH:MM:SS")
-            sys.exit(1)
-    elif args.timestamp:
-        timestamp = args.timestamp
-    
-    # Interactive mode
-    if args.interactive:
+        bitrate=args.bitrate,
+        verbose=not args.quiet
+    ) as sender:
+        # Handle timestamp/datetime conversion for FC 08
+        timestamp = None
+        if args.datetime:
+            try:
+                dt = datetime.strptime(args.datetime, "%Y-%m-%d %H:%M:%S")
+                timestamp = int(dt.timestamp()) - EPOCH_BASE
+                print(f"Converted datetime to timestamp: {timestamp}")
+            except ValueError as e:
+                print(f"✗ Error: Invalid datetime format: {e}")
+                print("  Use format: YYYY-MM-DD HH:MM:SS")
+                sys.exit(1)
+        elif args.timestamp:
+            timestamp = args.timestamp
+        
+        # Interactive mode
+        if args.interactive:
+            if args.msg:
+                success = sender.interactive_send(msg_name=args.msg)
+            elif args.id:
+                can_id = parse_can_id(args.id)
+                if can_id is None:
+                    print(f"✗ Error: Invalid CAN ID: {args.id}")
+                    sys.exit(1)
+                
+                is_extended = True
+                if args.standard:
+                    is_extended = False
+                elif not args.extended:
+                    # Auto-detect: if ID > 0x7FF, assume extended
+                    is_extended = (can_id > 0x7FF)
+                
+                success = sender.interactive_send(can_id=can_id, is_extended=is_extended)
+            else:
+                success = sender.interactive_send()
+            
+            sys.exit(0 if success else 1)
+        
+        # Parse data if provided
+        data = None
+        if args.data:
+            data = sender.parse_data_string(args.data)
+            if data is None:
+                sys.exit(1)
+        
+        # Send predefined message
         if args.msg:
-            success = sender.interactive_send(msg_name=args.msg)
+            success = sender.send_predefined_message(
+                msg_name=args.msg,
+                data=data,
+                timestamp=timestamp,
+                use_now=args.now
+            )
+        
+        # Send custom message by ID
         elif args.id:
             can_id = parse_can_id(args.id)
             if can_id is None:
                 print(f"✗ Error: Invalid CAN ID: {args.id}")
                 sys.exit(1)
             
+            if data is None:
+                print(f"✗ Error: Must specify --data for custom messages")
+                sys.exit(1)
+            
+            # Determine if extended or standard
             is_extended = True
             if args.standard:
                 is_extended = False
@@ -550,48 +720,9 @@ Data Format Options:
                 # Auto-detect: if ID > 0x7FF, assume extended
                 is_extended = (can_id > 0x7FF)
             
-            success = sender.interactive_send(can_id=can_id, is_extended=is_extended)
+            success = sender.send_message(can_id, data, is_extended)
         
         sys.exit(0 if success else 1)
-    
-    # Parse data if provided
-    data = None
-    if args.data:
-        data = sender.parse_data_string(args.data)
-        if data is None:
-            sys.exit(1)
-    
-    # Send predefined message
-    if args.msg:
-        success = sender.send_predefined_message(
-            msg_name=args.msg,
-            data=data,
-            timestamp=timestamp,
-            use_now=args.now
-        )
-    
-    # Send custom message by ID
-    elif args.id:
-        can_id = parse_can_id(args.id)
-        if can_id is None:
-            print(f"✗ Error: Invalid CAN ID: {args.id}")
-            sys.exit(1)
-        
-        if data is None:
-            print(f"✗ Error: Must specify --data for custom messages")
-            sys.exit(1)
-        
-        # Determine if extended or standard
-        is_extended = True
-        if args.standard:
-            is_extended = False
-        elif not args.extended:
-            # Auto-detect: if ID > 0x7FF, assume extended
-            is_extended = (can_id > 0x7FF)
-        
-        success = sender.send_message(can_id, data, is_extended)
-    
-    sys.exit(0 if success else 1)
 
 
 if __name__ == '__main__':
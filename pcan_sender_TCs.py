@@ -6,8 +6,13 @@ Install: pip install python-can
 """
 
 import can
+import errno
+import os
 import time
 import sys
+import queue
+import threading
+from dataclasses import dataclass
 
 
 # ==================== TEST CASE DEFINITIONS ====================
@@ -133,6 +138,9 @@ CONFIG = {
     'channel': 'PCAN_USBBUS1',
     'bitrate': 250000,
     'delay_between_messages': 0.1,  # seconds
+    'tx_queue_size': 64,            # frames buffered ahead of the TX thread
+    'tx_retries': 5,                # resend attempts when the driver queue is full
+    'send_timeout': 0.01,           # seconds bus.send() may block while the TX buffer is full
 }
 
 # ===========================================================
@@ -143,6 +151,9 @@ class CANSender:
     
     def __init__(self, interface, channel, bitrate):
         self.bus = None
+        self._tx_queue = None
+        self._tx_thread = None
+        self.sent_count = 0
         try:
             self.bus = can.Bus(interface=interface, channel=channel, bitrate=bitrate)
             print(f"✓ Connected: {self.bus.channel_info}")
@@ -150,35 +161,118 @@ class CANSender:
             print(f"✗ Connection failed: {e}")
             sys.exit(1)
     
-    def send(self, can_id, data, description=""):
-        """Send CAN message"""
+    def transmit(self, msg, retries=0, timeout=0.01):
+        """Put a can.Message on the bus, retrying while the TX buffer is full; returns the error or None"""
+        for attempt in range(retries + 1):
+            try:
+                self.bus.send(msg, timeout=timeout)
+                return None
+            except can.CanError as e:
+                # Anything but a full buffer (bus-off, unplugged adapter...) won't clear by waiting
+                if attempt == retries or not is_tx_full(e):
+                    return e
+                time.sleep(0.001)
+    
+    # ==================== THREADED TX ====================
+    
+    def start_tx_thread(self, maxsize=64, retries=5, timeout=0.01):
+        """Start a background thread that drains queued frames onto the bus"""
+        self._tx_queue = queue.Queue(maxsize)
+        self._tx_thread = threading.Thread(target=self._drain, args=(retries, timeout), daemon=True)
+        self._tx_thread.start()
+    
+    def _drain(self, retries, timeout):
+        """TX thread body: send queued frames in order until the None sentinel"""
+        get, task_done = self._tx_queue.get, self._tx_queue.task_done
+        transmit = self.transmit
+        
+        # Log lines are pre-encoded; write them straight to the fd when there is one
         try:
-            # Determine if extended ID (>11 bits)
-            is_extended = can_id > 0x7FF
-            
-            msg = can.Message(
-                arbitration_id=can_id,
-                data=data,
-                is_extended_id=is_extended
-            )
-            self.bus.send(msg)
-            
-            data_hex = ' '.join(f'{b:02X}' for b in data)
-            id_type = "Ext" if is_extended else "Std"
-            desc_str = f" # {description}" if description else ""
-            print(f"[SENT] ID=0x{can_id:X} ({id_type}), Data=[{data_hex}]{desc_str}")
-            return True
-            
-        except can.CanError as e:
-            print(f"✗ Send failed: {e}")
-            return False
+            fd = sys.stdout.fileno()
+            write = lambda line: os.write(fd, line)
+        except (AttributeError, OSError):
+            write = lambda line: sys.stdout.write(line.decode())
+        
+        while True:
+            frame = get()
+            try:
+                if frame is None:
+                    return
+                error = transmit(frame.msg, retries, timeout)
+                if error is None:
+                    write(frame.line)
+                    self.sent_count += 1
+                else:
+                    print(f"{frame.prefix}✗ Send failed: {error}", flush=True)
+            finally:
+                task_done()
+    
+    def queue_frame(self, frame):
+        """Hand a Frame to the TX thread (blocks only if the queue is full)"""
+        self._tx_queue.put(frame)
+    
+    def wait_tx(self):
+        """Block until every queued frame has been handled"""
+        self._tx_queue.join()
     
     def close(self):
+        if self._tx_thread:
+            self._tx_queue.put(None)
+            self._tx_thread.join()
+            self._tx_thread = None
         if self.bus:
             self.bus.shutdown()
             print("✓ Disconnected")
 
 
+def is_tx_full(error):
+    """True if a send failed only because the driver's TX buffer/queue was full"""
+    # SocketCAN: ENOBUFS from the socket, or python-can's "Transmit buffer full" after its select()
+    # PCAN: PCAN_ERROR_XMTFULL / PCAN_ERROR_QXMTFULL, which python-can only exposes as error text
+    if getattr(error, 'error_code', None) == errno.ENOBUFS:
+        return True
+    return 'full' in str(error).lower()
+
+
+def format_sent(msg, description=""):
+    """'[SENT] ID=..., Data=[..] # description' log line for a sent frame"""
+    data_hex = msg.data.hex(' ').upper()
+    id_type = "Ext" if msg.is_extended_id else "Std"
+    desc_str = f" # {description}" if description else ""
+    return f"[SENT] ID=0x{msg.arbitration_id:X} ({id_type}), Data=[{data_hex}]{desc_str}"
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    """Pre-built test case step: ready-to-send message, its description and encoded log line"""
+    msg: can.Message
+    description: str
+    prefix: str
+    line: bytes
+
+
+def build_frames(messages):
+    """Pre-build the can.Message objects and log lines of a test case, once before sending"""
+    total = len(messages)
+    frames = []
+    for i, (can_id, data, description) in enumerate(messages, 1):
+        # can.Message adopts a bytearray as-is (anything else is copied into a new one)
+        msg = can.Message(arbitration_id=can_id, data=bytearray(data), is_extended_id=can_id > 0x7FF)
+        prefix = f"[{i}/{total}] "
+        line = f"{prefix}{format_sent(msg, description)}\n".encode()
+        frames.append(Frame(msg, description, prefix, line))
+    return frames
+
+
+def wait_until(deadline):
+    """Sleep until a perf_counter() deadline, spinning through the last millisecond"""
+    remaining = deadline - time.perf_counter()
+    if remaining > 0.002:
+        time.sleep(remaining - 0.001)
+    while time.perf_counter() < deadline:
+        pass
+
+
 def run_test_case(sender, tc_number, delay):
     """Execute a specific test case"""
     
@@ -198,14 +292,23 @@ def run_test_case(sender, tc_number, delay):
     print(f"Total messages: {len(messages)}")
     print(f"{'='*70}\n")
     
-    success_count = 0
-    for i, (can_id, data, description) in enumerate(messages, 1):
-        print(f"[{i}/{len(messages)}] ", end="")
-        if sender.send(can_id, data, description):
-            success_count += 1
+    frames = build_frames(messages)
+    
+    # The TX thread does the blocking bus.send(); this loop only keeps time
+    sent_before = sender.sent_count
+    queue_frame = sender.queue_frame
+    total = len(frames)
+    sys.stdout.flush()  # The TX thread writes log lines to the fd, bypassing this buffer
+    start = time.perf_counter()
+    for i, frame in enumerate(frames, 1):
+        queue_frame(frame)
         
-        if i < len(messages):  # Don't delay after last message
-            time.sleep(delay)
+        if i < total:  # Don't delay after last message
+            # Pace against absolute deadlines so per-frame jitter doesn't accumulate
+            wait_until(start + i * delay)
+    
+    sender.wait_tx()
+    success_count = sender.sent_count - sent_before
     
     print(f"\n{'='*70}")
     print(f"Test Case {tc_number} completed: {success_count}/{len(messages)} messages sent")
@@ -253,6 +356,7 @@ def main():
         CONFIG['channel'],
         CONFIG['bitrate']
     )
+    sender.start_tx_thread(CONFIG['tx_queue_size'], CONFIG['tx_retries'], CONFIG['send_timeout'])
     
     try:
         # Run the specified test case
@@ -6,9 +6,14 @@ Install: pip install python-can
 """
 
 import can
+import os
 import time
 import sys
+import struct
+import functools
+import selectors
 import threading
+from collections import defaultdict, namedtuple
 
 
 # ==================== TEST CASE DEFINITIONS ====================
@@ -179,9 +184,48 @@ CONFIG = {
     'channel': 'PCAN_USBBUS1',
     'bitrate': 250000,
     'delay_between_messages': 0.0,  # NO DELAY - send immediately
+    'send_timeout': 0.01,            # seconds bus.send() may block while the TX buffer is full
     'verification_timeout': 5.0,     # seconds to wait for verification message
+    'cpu_affinity': None,            # e.g. {3}: pin to an isolated core (Linux only)
+    'realtime_priority': None,       # e.g. 50: SCHED_FIFO priority (Linux, root only)
 }
 
+# ==================== PREBUILT FRAMES ====================
+
+# Linux struct can_frame: can_id (with EFF flag), len, flags, pad, len8_dlc, 8 data bytes
+# (same layout python-can's SocketCAN backend writes)
+CAN_EFF_FLAG = 0x80000000
+_CAN_FRAME = struct.Struct("=IBB1xB8s")
+
+
+def pack_can_frame(msg):
+    """Serialize a can.Message to the 16-byte SocketCAN wire struct"""
+    can_id = msg.arbitration_id | (CAN_EFF_FLAG if msg.is_extended_id else 0)
+    return _CAN_FRAME.pack(can_id, msg.dlc, 0, msg.dlc, bytes(msg.data))
+
+
+# A test case's frames ready for send_batch(); TEST_CASES itself is left as written
+PreparedCase = namedtuple('PreparedCase', ['msgs', 'descriptions', 'raw'])
+
+
+@functools.cache
+def prepare_test_case(tc_number):
+    """Build a test case's can.Message objects on first use and cache them"""
+    # Only the case being run pays for Message construction; descriptions
+    # are kept as a parallel tuple so the burst never unpacks tuples.
+    messages = TEST_CASES[tc_number]['messages']
+    msgs = tuple(
+        can.Message(arbitration_id=can_id, data=bytearray(data), is_extended_id=can_id > 0x7FF, check=False)
+        for can_id, data, _ in messages
+    )
+    return PreparedCase(
+        msgs=msgs,
+        descriptions=tuple(description for _, _, description in messages),
+        # Pre-serialized frames for writing straight to a SocketCAN socket
+        raw=tuple(pack_can_frame(msg) for msg in msgs),
+    )
+
+
 # ===========================================================
 
 
@@ -190,29 +234,75 @@ class CANListener:
     
     def __init__(self, bus):
         self.bus = bus
-        self.received_messages = []
+        # arbitration_id -> (payload as little-endian int, length, msg), in arrival order
+        self.by_id = defaultdict(list)
         self.listening = False
-        self.thread = None
+        self._notifier = None
+        self._event = threading.Event()  # Set by the receive thread on every frame
+        # fd-based receive (SocketCAN): selector thread plus a pipe to wake it for stop()
+        self._thread = None
+        self._wake_w = None
     
     def start(self):
         """Start listening for CAN messages"""
         self.listening = True
-        self.received_messages = []
-        self.thread = threading.Thread(target=self._listen, daemon=True)
-        self.thread.start()
+        self.by_id = defaultdict(list)
+        self._event.clear()
+        
+        try:
+            fd = self.bus.fileno()
+        except NotImplementedError:
+            fd = -1
+        
+        if fd >= 0:
+            # Block on the bus fd itself: one wake-up per burst of frames, none while idle
+            wake_r, self._wake_w = os.pipe()
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+            selector.register(wake_r, selectors.EVENT_READ)
+            self._thread = threading.Thread(target=self._select_loop, args=(selector, wake_r), daemon=True)
+            self._thread.start()
+        else:
+            # Notifier's thread blocks in bus.recv() and hands each frame to _on_message
+            self._notifier = can.Notifier(self.bus, [self._on_message], timeout=0.1)
     
     def stop(self):
         """Stop listening for CAN messages"""
         self.listening = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
-    
-    def _listen(self):
-        """Background thread to listen for messages"""
-        while self.listening:
-            msg = self.bus.recv(timeout=0.1)
-            if msg:
-                self.received_messages.append(msg)
+        if self._notifier:
+            self._notifier.stop(timeout=1.0)
+            self._notifier = None
+        if self._thread:
+            os.write(self._wake_w, b'\0')
+            self._thread.join(timeout=1.0)
+            os.close(self._wake_w)
+            self._thread = None
+            self._wake_w = None
+    
+    def _select_loop(self, selector, wake_r):
+        """Receive thread for fd-capable buses: wait until readable, then drain"""
+        recv = self.bus.recv
+        on_message = self._on_message
+        try:
+            while True:
+                for key, _ in selector.select():
+                    if key.fd == wake_r:
+                        return
+                # Drain everything already queued without blocking
+                msg = recv(timeout=0)
+                while msg is not None:
+                    on_message(msg)
+                    msg = recv(timeout=0)
+        finally:
+            selector.close()
+            os.close(wake_r)
+    
+    def _on_message(self, msg):
+        """Notifier callback: store the frame and wake any waiting check"""
+        # Payload is encoded once here so every later pattern check is a plain int compare
+        data = msg.data
+        self.by_id[msg.arbitration_id].append((int.from_bytes(data, 'little'), len(data), msg))
+        self._event.set()
     
     def check_message_received(self, expected_id, expected_data, timeout=5.0):
         """
@@ -226,23 +316,32 @@ class CANListener:
         Returns:
             (found, actual_message) tuple
         """
-        start_time = time.time()
+        # Monotonic deadline: immune to wall-clock (NTP) adjustments mid-wait
+        deadline = time.monotonic_ns() + int(timeout * 1e9)
+        frames = self.by_id[expected_id]  # Only frames with this ID are ever scanned
+        checked = 0
         
-        while time.time() - start_time < timeout:
-            for msg in self.received_messages:
-                if msg.arbitration_id == expected_id:
-                    # Check data match (None = wildcard)
-                    data_match = True
-                    for i, expected_byte in enumerate(expected_data):
-                        if expected_byte is not None:
-                            if i >= len(msg.data) or msg.data[i] != expected_byte:
-                                data_match = False
-                                break
-                    
-                    if data_match:
-                        return True, msg
+        # Fold the pattern into one masked integer compare (None = wildcard byte)
+        mask = int.from_bytes(bytes(0x00 if b is None else 0xFF for b in expected_data), 'little')
+        value = int.from_bytes(bytes(b or 0 for b in expected_data), 'little')
+        # Frames must reach the last non-wildcard byte
+        min_len = max((i + 1 for i, b in enumerate(expected_data) if b is not None), default=0)
+        
+        while True:
+            # Clear before scanning so a frame arriving mid-scan still wakes the wait
+            self._event.clear()
+            # Lists are append-only here, so only frames added since the last pass are new
+            while checked < len(frames):
+                payload, length, msg = frames[checked]
+                checked += 1
+                
+                if length >= min_len and payload & mask == value:
+                    return True, msg
             
-            time.sleep(0.01)
+            remaining = deadline - time.monotonic_ns()
+            if remaining <= 0:
+                break
+            self._event.wait(remaining / 1e9)
         
         return False, None
 
@@ -253,34 +352,87 @@ class CANSender:
     def __init__(self, interface, channel, bitrate):
         self.bus = None
         self.listener = None
+        self._log = None  # (msgs, descriptions, {index: error}) of the last batch
+        self._raw_socket = None  # SocketCAN raw socket, if any, for pre-serialized frames
         try:
             self.bus = can.Bus(interface=interface, channel=channel, bitrate=bitrate)
+            if interface == 'socketcan':
+                self._raw_socket = getattr(self.bus, 'socket', None)
             self.listener = CANListener(self.bus)
             print(f"✓ Connected: {self.bus.channel_info}")
         except can.CanError as e:
             print(f"✗ Connection failed: {e}")
             sys.exit(1)
     
-    def send(self, can_id, data, description=""):
-        """Send CAN message"""
-        try:
-            is_extended = can_id > 0x7FF
-            msg = can.Message(
-                arbitration_id=can_id,
-                data=data,
-                is_extended_id=is_extended
-            )
-            self.bus.send(msg)
+    def send_batch(self, msgs, descriptions, raw=None, delay=0.0, timeout=0.01):
+        """
+        Send pre-built can.Message objects back-to-back
+        On SocketCAN, `raw` (pack_can_frame() bytes per message) is written
+        straight to the socket instead, skipping python-can's serialization.
+        `timeout` lets the driver apply back-pressure instead of failing at once
+        when its TX buffer is full; `delay` > 0 spaces the frames out.
+        Nothing is logged here; call write_log() afterwards
+        
+        Returns:
+            Number of messages sent successfully
+        """
+        writable = None
+        if raw is not None and self._raw_socket is not None:
+            # CAN_RAW fails with ENOBUFS instead of blocking when the TX queue is full,
+            # so wait for writability first, as python-can's send() does
+            sock = self._raw_socket
+            writable = selectors.DefaultSelector()
+            writable.register(sock, selectors.EVENT_WRITE)
             
-            data_hex = ' '.join(f'{b:02X}' for b in data)
-            id_type = "Ext" if is_extended else "Std"
-            desc_str = f" # {description}" if description else ""
-            print(f"[SENT] ID=0x{can_id:X} ({id_type}), Data=[{data_hex}]{desc_str}")
-            return True
+            def send(frame):
+                if not writable.select(timeout):
+                    raise can.CanOperationError("Transmit buffer full")
+                sock.send(frame)
             
-        except can.CanError as e:
-            print(f"✗ Send failed: {e}")
-            return False
+            frames, failure = raw, (OSError, can.CanError)
+        else:
+            send, frames, failure = functools.partial(self.bus.send, timeout=timeout), msgs, can.CanError
+        sleep = time.sleep
+        total = len(frames)
+        errors = {}  # index -> error, only for frames that failed
+        
+        # The try sits outside the inner loop; on an error, note it and resume after that frame
+        start = 0
+        while start < total:
+            i = start
+            try:
+                for i in range(start, total):
+                    send(frames[i])
+                    if delay:
+                        sleep(delay)
+                break
+            except failure as e:
+                errors[i] = e
+                start = i + 1
+        
+        if writable is not None:
+            writable.close()
+        self._log = (msgs, descriptions, errors)
+        return total - len(errors)
+    
+    def write_log(self):
+        """Format the last batch's log and write it in one go"""
+        if self._log is None:
+            return
+        msgs, descriptions, errors = self._log
+        total = len(msgs)
+        lines = []
+        for i, (msg, description) in enumerate(zip(msgs, descriptions)):
+            error = errors.get(i)
+            if error is not None:
+                lines.append(f"[{i + 1}/{total}] ✗ Send failed: {error}\n")
+                continue
+            data_hex = msg.data.hex(' ').upper()
+            id_type = "Ext" if msg.is_extended_id else "Std"
+            desc_str = f" # {description}" if description else ""
+            lines.append(f"[{i + 1}/{total}] [SENT] ID=0x{msg.arbitration_id:X} ({id_type}), Data=[{data_hex}]{desc_str}\n")
+        self._log = None
+        sys.stdout.write("".join(lines))
     
     def verify_message(self, expected_id, expected_data, timeout=5.0):
         """
@@ -294,12 +446,13 @@ class CANSender:
         Returns:
             True if message received, False otherwise
         """
-        print(f"\n[VERIFY] Waiting for ID=0x{expected_id:X}, Data={expected_data}, Timeout={timeout}s")
+        # Flush so the wait is visible while stdout is block-buffered
+        print(f"\n[VERIFY] Waiting for ID=0x{expected_id:X}, Data={expected_data}, Timeout={timeout}s", flush=True)
         
         found, msg = self.listener.check_message_received(expected_id, expected_data, timeout)
         
         if found:
-            data_hex = ' '.join(f'{b:02X}' for b in msg.data)
+            data_hex = msg.data.hex(' ').upper()
             print(f"[VERIFY] ✓ Received: ID=0x{msg.arbitration_id:X}, Data=[{data_hex}]")
             return True
         else:
@@ -339,16 +492,16 @@ def run_test_case(sender, tc_number, delay):
     sender.listener.start()
     
     # Send all messages IMMEDIATELY - no delay
-    success_count = 0
+    prepared = prepare_test_case(tc_number)
     start_time = time.time()
-    
-    for i, (can_id, data, description) in enumerate(messages, 1):
-        print(f"[{i}/{len(messages)}] ", end="")
-        if sender.send(can_id, data, description):
-            success_count += 1
-        # NO DELAY - send next message immediately
-    
+    success_count = sender.send_batch(
+        prepared.msgs, prepared.descriptions, prepared.raw,
+        delay, CONFIG['send_timeout']
+    )
     elapsed = time.time() - start_time
+    
+    # Logging happens after the timed burst
+    sender.write_log()
     print(f"\n⚡ All {len(messages)} messages sent in {elapsed*1000:.2f}ms")
     
     # Verify expected response from Display
@@ -386,10 +539,32 @@ def run_test_case(sender, tc_number, delay):
     print(f"Verification: {'PASSED' if verification_passed else 'FAILED'}")
     print(f"Test Case {tc_number}: {'PASSED ✓' if verification_passed else 'FAILED ✗'}")
     print(f"{'='*70}\n")
+    sys.stdout.flush()
     
     return verification_passed
 
 
+def apply_scheduling(cpus=None, priority=None):
+    """Pin the process to `cpus` and/or switch to SCHED_FIFO, where the OS allows it"""
+    # Threads started afterwards (the listener's Notifier thread) inherit both settings
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, cpus)
+            print(f"✓ Pinned to CPU(s) {sorted(cpus)}")
+        except OSError as e:
+            print(f"⚠ Could not set CPU affinity: {e}")
+    
+    if priority and hasattr(os, 'sched_setscheduler'):
+        if os.geteuid() != 0:
+            print("⚠ SCHED_FIFO needs root - keeping default scheduling")
+            return
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            print(f"✓ SCHED_FIFO priority {priority}")
+        except OSError as e:
+            print(f"⚠ Could not set SCHED_FIFO: {e}")
+
+
 def parse_arguments():
     """Parse command line arguments"""
     tc_number = None
@@ -417,6 +592,11 @@ def print_usage():
 
 
 def main():
+    # Block-buffer stdout (even on a terminal) so the many short log lines
+    # go out in a few large writes; run_test_case flushes at its checkpoints
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     tc_number = parse_arguments()
     
     if tc_number is None:
@@ -424,6 +604,8 @@ def main():
         print_usage()
         sys.exit(1)
     
+    apply_scheduling(CONFIG['cpu_affinity'], CONFIG['realtime_priority'])
+    
     sender = CANSender(
         CONFIG['interface'],
         CONFIG['channel'],
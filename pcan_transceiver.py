@@ -23,10 +23,12 @@ Usage:
   python pcan_transceiver.py --send --msg CURRENT_DATETIME_CONNECTIVITY --now
   python pcan_transceiver.py --send --msg CURRENT_DATETIME_CONNECTIVITY --datetime "2026-02-03 07:00:00"
   python pcan_transceiver.py --send --id 0x123 --data "01 02 03"
+  python pcan_transceiver.py --send --id 0x123 --data "01 02 03" --count 100 --period 0.01
   
   # INTERACTIVE MODE
   python pcan_transceiver.py --interactive --msg BI_RESULTS
   python pcan_transceiver.py --interactive --id 0x100
+  python pcan_transceiver.py --interactive    (prompts for the name; Tab completes)
   
   # MONITOR MODE
   python pcan_transceiver.py --monitor
@@ -41,9 +43,22 @@ Install: pip install python-can
 import sys
 import time
 import argparse
+import functools
+from array import array
+import queue
+import re
+import selectors
+import threading
 from datetime import datetime, timezone
 import struct
 
+# Line editing and message-name completion for interactive mode (not available
+# everywhere, e.g. Windows without pyreadline3)
+try:
+    import readline
+except ImportError:
+    readline = None
+
 try:
     import can
 except ImportError:
@@ -52,11 +67,17 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from can_messages_config import PREDEFINED_MESSAGES
+    from can_messages_config import PREDEFINED_MESSAGES, MESSAGE_ALIASES, decoder_for
 except ImportError:
     print("WARNING: can_messages_config.py not found!")
     print("Predefined message features will not be available.")
     PREDEFINED_MESSAGES = {}
+    MESSAGE_ALIASES = {}
+
+# Upper-cased name (or old alias) -> definition, so names typed in any case resolve with one lookup
+_PREDEF_UPPER = {name.upper(): msg_def for name, msg_def in PREDEFINED_MESSAGES.items()}
+_PREDEF_UPPER.update((alias, PREDEFINED_MESSAGES[name]) for alias, name in MESSAGE_ALIASES.items())
+_PREDEF_SORTED = sorted(PREDEFINED_MESSAGES)  # Names in listing order, shared by --list and --diagnose
 
 # ==================== CONFIGURATION ====================
 
@@ -64,9 +85,27 @@ CAN_CONFIG = {
     'interface': 'pcan',
     'channel': 'PCAN_USBBUS1',
     'bitrate': 250000,
+    'busy_poll': 0,  # Seconds to spin on non-blocking reads before blocking (buses without an fd, 0=off)
 }
 
 EPOCH_BASE = 1451606400  # Unix timestamp for 2016-01-01 00:00:00 UTC
+FC08_STRUCT = struct.Struct('<IB')  # FC 08 payload: uint32 timestamp + reserved byte
+
+# Per-frame table rows, formatted from prebuilt templates (keyed by is_extended_id)
+_ID_FMT = {True: "0x{:08X}", False: "0x{:03X}"}
+_ID_TYPE = {True: "Ext", False: "Std"}
+_HEX_LUT = tuple(f'{i:02X}' for i in range(256))  # Byte -> two-digit hex, for patterns that can't go through bytes.hex()
+_BIN_LUT = tuple(f'{i:08b}' for i in range(256))  # Byte -> eight-digit binary, for bit field details
+_ROW_FMT_SIMPLE = "{:<26} {:<12} {:<6} {:<4} {:<30}\n".format
+_ROW_FMT = "{:<26} {:<12} {:<6} {:<4} {:<30} {:<10}\n".format
+_ROW_FMT_MULTI = "{:<26} {:<12} {:<6} {:<4} {:<30} {:<15}\n".format
+ROWS_PER_FLUSH = 64  # Buffered frame rows are pushed out when the bus idles or after this many
+
+# pcan_receiver.py style KEY=value arguments (MSG=, ID=, DATA=, TIMEOUT=)
+RECEIVER_KV_RE = re.compile(r'(MSG|ID|DATA|TIMEOUT)=(.*)', re.IGNORECASE | re.DOTALL)
+# Flags that may accompany --monitor and still mean receiver-style mode
+RECEIVER_FLAGS = frozenset(['--monitor', '-m', '--quiet', '-q', '--first', '-f', '--all', '-a',
+                            '--verbose', '-v', '--list', '-l'])
 
 NODE_IDS = {
     'CONNECTIVITY': 0x11,
@@ -75,7 +114,6 @@ NODE_IDS = {
     'SENSOR_CONTROL': 0x1E,
 }
 
-
 class CANTransceiver:
     """Complete CAN sender and receiver with all features"""
     
@@ -83,6 +121,8 @@ class CANTransceiver:
         """Initialize CAN bus connection"""
         self.bus = None
         self.listening = False
+        self._last_sec = None  # Second last formatted by _fmt_ts()
+        self._last_sec_str = ''
         
         try:
             self.bus = can.Bus(interface=interface, channel=channel, bitrate=bitrate)
@@ -112,6 +152,12 @@ class CANTransceiver:
             except:
                 pass
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def stop_listening(self):
         """Stop listening"""
         self.listening = False
@@ -153,27 +199,36 @@ class CANTransceiver:
             print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30} {'Match':<10}")
             print(f"{'-'*80}")
         
-        start_time = time.time()
+        match_data = compile_matcher(target_data)
+        self._prepare_decoder(decode_info)
+        if quiet_mode:
+            if decode_info:
+                id_types = [decode_info.get('extended', True)]
+            else:
+                # ID= targets don't say which ID type they use: accept both for 11-bit IDs
+                id_types = [False, True] if target_id <= 0x7FF else [True]
+            self._set_filters([(target_id, extended) for extended in id_types])
+        id_only = match_data is None  # No DATA= pattern: the ID compare is the whole match
+        print_row = self._print_message
+        now = time.time
+        start_time = now()
+        deadline = start_time + timeout if timeout > 0 else None
+        frames = self._receive(deadline)
         msg_count = 0
         match_count = 0
-        matched_messages = []
+        match_times = array('d')  # msg.timestamp of each match, only formatted for the summary
         header_printed = False
         
         try:
-            while True:
-                if timeout > 0 and (time.time() - start_time) > timeout:
+            for msg in frames:
+                if deadline is not None and now() > deadline:
                     break
                 
-                try:
-                    msg = self.bus.recv(timeout=0.1)
-                except KeyboardInterrupt:
-                    raise
-                
                 if msg is None:
                     continue
                 
                 msg_count += 1
-                is_match = self._check_match(msg, target_id, target_data)
+                is_match = msg.arbitration_id == target_id and (id_only or match_data(msg.data))
                 
                 if quiet_mode:
                     if is_match:
@@ -181,19 +236,13 @@ class CANTransceiver:
                             print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30} {'Match':<10}")
                             print(f"{'-'*80}")
                             header_printed = True
-                        self._print_message(msg, match=True)
+                        print_row(msg, match=True)
                 else:
-                    self._print_message(msg, match=is_match)
+                    print_row(msg, match=is_match)
                 
                 if is_match:
                     match_count += 1
-                    current_ts = datetime.now()
-                    matched_messages.append({
-                        'timestamp': current_ts,
-                        'timestamp_str': current_ts.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                        'message': msg,
-                        'time_from_start': time.time() - start_time
-                    })
+                    match_times.append(msg.timestamp)
                     
                     self._print_match_details(msg, match_count, decode_info)
                     
@@ -202,19 +251,24 @@ class CANTransceiver:
                 
         except KeyboardInterrupt:
             print(f"\n\n\u2713 Stopped by user (Ctrl+C)")
+        finally:
+            if quiet_mode:
+                self._set_filters(None)  # Later listens/monitoring see all traffic again
         
-        elapsed = time.time() - start_time
+        elapsed = now() - start_time
         print(f"\n{'='*80}")
-        print(f"SUMMARY: {elapsed:.2f}s | Messages: {msg_count} | Matches: {match_count}")
+        # Quiet listens filter on the bus, so only frames with a target ID were seen
+        seen = "Frames seen (filtered)" if quiet_mode else "Messages"
+        print(f"SUMMARY: {elapsed:.2f}s | {seen}: {msg_count} | Matches: {match_count}")
         print(f"{'='*80}")
         
-        if matched_messages:
-            if len(matched_messages) <= 5:
-                for i, m in enumerate(matched_messages, 1):
-                    print(f"  #{i}: {m['timestamp_str']} (+{m['time_from_start']:.2f}s)")
+        if match_times:
+            if len(match_times) <= 5:
+                for i, ts in enumerate(match_times, 1):
+                    print(f"  #{i}: {self._fmt_ts(ts)} (+{ts - start_time:.2f}s)")
             else:
-                print(f"  First: {matched_messages[0]['timestamp_str']}")
-                print(f"  Last:  {matched_messages[-1]['timestamp_str']}")
+                print(f"  First: {self._fmt_ts(match_times[0])}")
+                print(f"  Last:  {self._fmt_ts(match_times[-1])}")
         
         print(f"{'='*80}\n")
         
@@ -245,33 +299,44 @@ class CANTransceiver:
             print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30} {'Match':<15}")
             print(f"{'-'*95}")
         
-        start_time = time.time()
+        now = time.time
+        start_time = now()
+        deadline = start_time + timeout if timeout > 0 else None
         msg_count = 0
+        total_matches = 0
         header_printed = False
         
-        match_results = {}
+        match_results = {}   # CAN ID (int) -> result; hex text is only formatted for display
+        targets_by_id = {}   # CAN ID -> [target, ...] so each frame only checks targets with its ID
         for target in targets:
-            key = f"0x{target['id']:X}"
-            match_results[key] = {'name': target.get('name', key), 'count': 0, 'matches': []}
+            tid = target['id']
+            match_results[tid] = {'name': target.get('name', f"0x{tid:X}"), 'count': 0, 'ts': array('d')}
+            targets_by_id.setdefault(tid, []).append(target)
+            if '_match' not in target:
+                target['_match'] = compile_matcher(target['data'])
+            self._prepare_decoder(target.get('decode_info'))
+        
+        frames = self._receive(deadline)
+        get_targets = targets_by_id.get
+        print_row = self._print_message_multi
+        if quiet_mode:
+            self._set_filters((t['id'], t['decode_info'].get('extended', True) if t.get('decode_info') else None)
+                              for t in targets)
         
         try:
-            while True:
-                if timeout > 0 and (time.time() - start_time) > timeout:
+            for msg in frames:
+                if deadline is not None and now() > deadline:
                     break
                 
-                try:
-                    msg = self.bus.recv(timeout=0.1)
-                except KeyboardInterrupt:
-                    raise
-                
                 if msg is None:
                     continue
                 
                 msg_count += 1
                 
                 matched_target = None
-                for target in targets:
-                    if self._check_match(msg, target['id'], target['data']):
+                for target in get_targets(msg.arbitration_id, ()):
+                    match_data = target['_match']
+                    if match_data is None or match_data(msg.data):
                         matched_target = target
                         break
                 
@@ -281,24 +346,18 @@ class CANTransceiver:
                             print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30} {'Match':<15}")
                             print(f"{'-'*95}")
                             header_printed = True
-                        self._print_message_multi(msg, match=True, match_name=matched_target.get('name', ''))
+                        print_row(msg, match=True, match_name=matched_target.get('name', ''))
                 else:
                     match_name = matched_target.get('name', '') if matched_target else None
-                    self._print_message_multi(msg, match=(matched_target is not None), match_name=match_name)
+                    print_row(msg, match=(matched_target is not None), match_name=match_name)
                 
                 if matched_target:
-                    key = f"0x{matched_target['id']:X}"
-                    match_results[key]['count'] += 1
+                    result = match_results[matched_target['id']]
+                    result['count'] += 1
+                    total_matches += 1
                     
-                    current_ts = datetime.now()
-                    match_results[key]['matches'].append({
-                        'timestamp': current_ts,
-                        'timestamp_str': current_ts.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                        'message': msg,
-                        'time_from_start': time.time() - start_time
-                    })
+                    result['ts'].append(msg.timestamp)
                     
-                    total_matches = sum(r['count'] for r in match_results.values())
                     self._print_match_details(msg, total_matches, matched_target.get('decode_info'))
                     
                     if not collect_all:
@@ -306,23 +365,27 @@ class CANTransceiver:
                 
         except KeyboardInterrupt:
             print(f"\n\n\u2713 Stopped by user (Ctrl+C)")
+        finally:
+            if quiet_mode:
+                self._set_filters(None)  # Later listens/monitoring see all traffic again
         
-        elapsed = time.time() - start_time
-        total_matches = sum(r['count'] for r in match_results.values())
+        elapsed = now() - start_time
         
         print(f"\n{'='*80}")
-        print(f"SUMMARY: {elapsed:.2f}s | Messages: {msg_count} | Matches: {total_matches}")
+        # Quiet listens filter on the bus, so only frames with a target ID were seen
+        seen = "Frames seen (filtered)" if quiet_mode else "Messages"
+        print(f"SUMMARY: {elapsed:.2f}s | {seen}: {msg_count} | Matches: {total_matches}")
         print(f"{'='*80}")
         
-        for key, result in match_results.items():
+        for result in match_results.values():
             if result['count'] > 0:
                 print(f"\n{result['name']}: {result['count']} match(es)")
                 if result['count'] <= 5:
-                    for i, m in enumerate(result['matches'], 1):
-                        print(f"  #{i}: {m['timestamp_str']} (+{m['time_from_start']:.2f}s)")
+                    for i, ts in enumerate(result['ts'], 1):
+                        print(f"  #{i}: {self._fmt_ts(ts)} (+{ts - start_time:.2f}s)")
                 else:
-                    print(f"  First: {result['matches'][0]['timestamp_str']}")
-                    print(f"  Last:  {result['matches'][-1]['timestamp_str']}")
+                    print(f"  First: {self._fmt_ts(result['ts'][0])}")
+                    print(f"  Last:  {self._fmt_ts(result['ts'][-1])}")
         
         no_matches = [r['name'] for r in match_results.values() if r['count'] == 0]
         if no_matches:
@@ -340,33 +403,161 @@ class CANTransceiver:
         print(f"{'Timestamp':<26} {'ID':<12} {'Type':<6} {'DLC':<4} {'Data':<30}")
         print(f"{'-'*80}")
         
-        start_time = time.time()
+        print_row = self._print_message_simple
+        now = time.time
+        start_time = now()
+        deadline = start_time + duration if duration > 0 else None
+        frames = self._receive(deadline)
         msg_count = 0
         
         try:
-            while True:
-                if duration > 0 and (time.time() - start_time) > duration:
+            for msg in frames:
+                if deadline is not None and now() > deadline:
                     break
                 
-                try:
-                    msg = self.bus.recv(timeout=0.1)
-                except KeyboardInterrupt:
-                    raise
-                
                 if msg is None:
                     continue
                 
                 msg_count += 1
-                self._print_message_simple(msg)
+                print_row(msg)
                 
         except KeyboardInterrupt:
             print(f"\n\n\u2713 Stopped by user (Ctrl+C)")
         
-        elapsed = time.time() - start_time
+        elapsed = now() - start_time
         print(f"\n{'='*80}")
         print(f"Messages: {msg_count}, Duration: {elapsed:.2f}s")
         print(f"{'='*80}\n")
     
+    def _set_filters(self, targets):
+        """
+        Accept only the given (can_id, extended) targets on the bus, None = all traffic
+        Only quiet listens filter: verbose mode shows non-matching frames too. The
+        filters run in the kernel (SocketCAN) or adapter where supported; python-can
+        applies them in software on backends that can't
+        """
+        self.bus.set_filters(None if targets is None else build_acceptance_filters(targets))
+    
+    def _receive(self, deadline=None, idle_timeout=1.0, poll_timeout=0.1):
+        """
+        Yield received frames, or None after idle_timeout without traffic (or once
+        the time.time() deadline has passed)
+        A background thread drains the bus into a queue, so printing and decoding
+        here never hold up reception. Frame rows are printed to a block-buffered
+        stdout; it is flushed whenever the queue runs dry and after every
+        ROWS_PER_FLUSH frames. poll_timeout is the receive thread's recv timeout,
+        which bounds how long stopping takes
+        """
+        rx_queue = queue.SimpleQueue()  # Batches of frames, one per receive-thread wakeup
+        self.listening = True
+        rx_thread = threading.Thread(target=self._rx_loop, args=(rx_queue, poll_timeout), daemon=True)
+        rx_thread.start()
+        
+        get = rx_queue.get
+        get_nowait = rx_queue.get_nowait
+        flush = sys.stdout.flush
+        now = time.time
+        pending = 0
+        try:
+            while True:
+                try:
+                    batch = get_nowait()
+                except queue.Empty:
+                    # Caught up: show what was printed, then sleep until traffic or the deadline
+                    flush()
+                    pending = 0
+                    wait = idle_timeout if deadline is None else min(idle_timeout, max(deadline - now(), 0))
+                    try:
+                        batch = get(timeout=wait)
+                    except queue.Empty:
+                        yield None
+                        continue
+                if isinstance(batch, Exception):
+                    raise batch  # Bus error in the receive thread
+                yield from batch
+                pending += len(batch)
+                if pending >= ROWS_PER_FLUSH:
+                    flush()
+                    pending = 0
+        finally:
+            self.stop_listening()
+            rx_thread.join(timeout=1.0)
+    
+    def _rx_loop(self, rx_queue, poll_timeout):
+        """
+        Receive thread: move frame batches from the bus into rx_queue until stop_listening()
+        Frames are restamped with the wall-clock time they were received: python-can's
+        PCAN backend reports boot-relative timestamps unless the optional 'uptime'
+        package is installed, and rows, match details and summaries show epoch times
+        """
+        put = rx_queue.put
+        now = time.time
+        try:
+            for batch in self._read_frames(poll_timeout):
+                if not self.listening:
+                    break
+                if batch is not None:
+                    received = now()
+                    for msg in batch:
+                        msg.timestamp = received
+                    put(batch)
+        except Exception as e:
+            put(e)
+    
+    def _read_frames(self, poll_timeout):
+        """
+        Yield lists of frames straight from the bus, or None after each poll_timeout
+        without traffic. Each wakeup drains everything already queued with
+        non-blocking reads, so a burst costs one queue hand-off, not one per frame
+        """
+        recv = self.bus.recv
+        try:
+            fd = self.bus.fileno()
+        except NotImplementedError:
+            fd = -1
+        
+        if fd >= 0:
+            # fd-capable bus (SocketCAN): wait until readable, then drain everything queued
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+            try:
+                while True:
+                    if not selector.select(poll_timeout):
+                        yield None
+                        continue
+                    batch = []
+                    msg = recv(timeout=0)
+                    while msg is not None:
+                        batch.append(msg)
+                        msg = recv(timeout=0)
+                    yield batch
+            finally:
+                selector.close()
+        
+        # No fd (PCAN on Windows, virtual): optionally spin on non-blocking reads
+        # for busy_poll seconds before falling back to a blocking recv
+        busy_poll = CAN_CONFIG.get('busy_poll', 0)
+        while True:
+            msg = None
+            if busy_poll:
+                spin_until = time.monotonic() + busy_poll
+                while time.monotonic() < spin_until:
+                    msg = recv(timeout=0)
+                    if msg is not None:
+                        break
+                    time.sleep(0)
+            if msg is None:
+                msg = recv(timeout=poll_timeout)
+                if msg is None:
+                    yield None
+                    continue
+            batch = [msg]
+            msg = recv(timeout=0)
+            while msg is not None:
+                batch.append(msg)
+                msg = recv(timeout=0)
+            yield batch
+    
     # ==================== SENDING FUNCTIONS ====================
     
     def parse_data_string(self, data_str):
@@ -376,45 +567,45 @@ class CANTransceiver:
         
         data_str = data_str.replace(',', ' ').replace('-', ' ').strip()
         parts = data_str.split()
-        data = []
+        
+        # Fast path: all tokens are 1-2 hex digits (0x prefix allowed), decoded in one C call
+        values = hex_tokens_to_bytes(parts)
+        if values is not None:
+            return bytearray(values)
+        
+        # One pass for the common case, the checked loop below only runs to report the bad token
+        try:
+            return bytearray(int(part, 16) for part in parts)
+        except ValueError:
+            pass
         
         for part in parts:
             try:
-                if part.startswith('0x') or part.startswith('0X'):
-                    byte_val = int(part, 16)
-                else:
-                    byte_val = int(part, 16)
+                byte_val = int(part, 16)
                 
-                if 0 <= byte_val <= 255:
-                    data.append(byte_val)
-                else:
+                if not 0 <= byte_val <= 255:
                     print(f"\u2717 Error: Byte value {byte_val} out of range (0-255)")
                     return None
             except ValueError:
                 print(f"\u2717 Error: Invalid byte value '{part}'")
                 return None
         
-        return data
+        return None
     
     def build_fc08_data(self, timestamp=None):
         """Build FC 08 date/time data bytes"""
         if timestamp is None:
-            # Get current UTC time using timezone-aware method
-            dt = datetime.now(timezone.utc)
-            unix_timestamp = int(dt.timestamp())
-            timestamp = unix_timestamp - EPOCH_BASE
-        
-        data = []
-        data.append((timestamp >> 0) & 0xFF)
-        data.append((timestamp >> 8) & 0xFF)
-        data.append((timestamp >> 16) & 0xFF)
-        data.append((timestamp >> 24) & 0xFF)
-        data.append(0x00)
+            # time.time() is already UTC epoch seconds, no datetime object needed
+            timestamp = int(time.time()) - EPOCH_BASE
         
+        # 32-bit little-endian timestamp followed by a 0x00 byte, packed straight into
+        # the bytearray that becomes the frame payload
+        data = bytearray(FC08_STRUCT.size)
+        FC08_STRUCT.pack_into(data, 0, timestamp & 0xFFFFFFFF, 0x00)
         return data
     
-    def send_message(self, can_id, data, is_extended=True, msg_name=None):
-        """Send a CAN message"""
+    def send_message(self, can_id, data, is_extended=True, msg_name=None, count=1, period=0):
+        """Send a CAN message (count times, period seconds apart, if count > 1)"""
         if not data:
             data = []
         
@@ -430,7 +621,10 @@ class CANTransceiver:
                 dlc=len(data)
             )
             
-            self.bus.send(msg)
+            if count > 1:
+                self.send_many([msg], count, period)
+            else:
+                self.bus.send(msg)
             
             print("\n" + "=" * 70)
             if msg_name:
@@ -442,11 +636,13 @@ class CANTransceiver:
             id_type = "Extended" if is_extended else "Standard"
             id_format = "0x{:08X}" if is_extended else "0x{:03X}"
             print(f"CAN ID:          {id_format.format(can_id)} ({id_type})")
-            print(f"Data:            {' '.join(f'{b:02X}' for b in data) if data else '(empty)'}")
+            print(f"Data:            {bytes(data).hex(' ').upper() if data else '(empty)'}")
             print(f"DLC:             {len(data)}")
+            if count > 1:
+                print(f"Count:           {count}" + (f" (every {period}s)" if period > 0 else ""))
             
-            if msg_name and msg_name in PREDEFINED_MESSAGES:
-                msg_config = PREDEFINED_MESSAGES[msg_name]
+            if msg_name and msg_name in _PREDEF_UPPER:
+                msg_config = _PREDEF_UPPER[msg_name]
                 print(f"\nMessage Info:")
                 print(f"  Description:   {msg_config.get('description', 'N/A')}")
                 if 'notes' in msg_config and msg_config['notes']:
@@ -462,14 +658,14 @@ class CANTransceiver:
             print(f"\u2717 Failed to send message: {e}")
             return False
     
-    def send_predefined_message(self, msg_name, data=None, timestamp=None, use_now=False):
+    def send_predefined_message(self, msg_name, data=None, timestamp=None, use_now=False, count=1, period=0):
         """Send a predefined message from config"""
-        if msg_name not in PREDEFINED_MESSAGES:
+        if msg_name not in _PREDEF_UPPER:
             print(f"\u2717 Error: Message '{msg_name}' not found in configuration")
             print(f"  Use --list to see available messages")
             return False
         
-        msg_config = PREDEFINED_MESSAGES[msg_name]
+        msg_config = _PREDEF_UPPER[msg_name]
         can_id = msg_config['id']
         is_extended = msg_config.get('extended', True)
         
@@ -489,7 +685,26 @@ class CANTransceiver:
                 print(f"  Or use --datetime to send specific date/time")
             return False
         
-        return self.send_message(can_id, data, is_extended, msg_name)
+        return self.send_message(can_id, data, is_extended, msg_name, count, period)
+    
+    def send_many(self, msgs, count=1, period=0):
+        """
+        Send a list of frames count times over, returns the number of frames sent
+        With a period the sends are paced against a perf_counter() schedule, so
+        sleep overshoot doesn't accumulate; a bus error raises CanError at the frame
+        that failed
+        """
+        total = len(msgs) * count
+        send = self.bus.send
+        next_time = time.perf_counter()
+        for i in range(total):
+            send(msgs[i % len(msgs)])
+            if period > 0 and i < total - 1:
+                next_time += period
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return total
     
     def interactive_send(self, msg_name=None, can_id=None, is_extended=True):
         """Interactive mode to build and send a message"""
@@ -497,13 +712,20 @@ class CANTransceiver:
         print("INTERACTIVE MESSAGE BUILDER")
         print("=" * 70)
         
+        # No --msg/--id: ask for a predefined message by name
+        if not msg_name and can_id is None:
+            msg_name = prompt_msg_name()
+            if not msg_name:
+                print("\u2717 No message name entered")
+                return False
+        
         # Get message info
         msg_config = None
         if msg_name:
-            if msg_name not in PREDEFINED_MESSAGES:
+            if msg_name not in _PREDEF_UPPER:
                 print(f"\u2717 Error: Message '{msg_name}' not found")
                 return False
-            msg_config = PREDEFINED_MESSAGES[msg_name]
+            msg_config = _PREDEF_UPPER[msg_name]
             can_id = msg_config['id']
             is_extended = msg_config.get('extended', True)
             
@@ -548,8 +770,7 @@ class CANTransceiver:
                 dt_str = input("Enter date/time (YYYY-MM-DD HH:MM:SS): ").strip()
                 try:
                     dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
-                    epoch_1970 = datetime(1970, 1, 1)
-                    unix_ts = int((dt - epoch_1970).total_seconds())
+                    unix_ts = int(dt.replace(tzinfo=timezone.utc).timestamp())
                     custom_ts = unix_ts - EPOCH_BASE
                     data = self.build_fc08_data(custom_ts)
                     print(f"Custom timestamp: {custom_ts} (seconds since 2016-01-01)")
@@ -574,7 +795,7 @@ class CANTransceiver:
         print(f"\n--- Ready to Send ---")
         id_format = "0x{:08X}" if is_extended else "0x{:03X}"
         print(f"ID:   {id_format.format(can_id)}")
-        print(f"Data: {' '.join(f'{b:02X}' for b in data)}")
+        print(f"Data: {bytes(data).hex(' ').upper()}")
         print(f"DLC:  {len(data)}")
         
         confirm = input("\nSend? [Y/n]: ").strip().lower()
@@ -586,238 +807,95 @@ class CANTransceiver:
     
     # ==================== DECODE FUNCTIONS ====================
     
-    def _decode_special_fields(self, msg, special_decode):
-        """Decode special fields from CAN message data"""
-        decoded = {}
-        
-        for field_name, field_info in special_decode.items():
-            try:
-                field_type = field_info['type']
-                
-                if field_type == '16bit':
-                    byte_indices = field_info['bytes']
-                    if all(idx < len(msg.data) for idx in byte_indices):
-                        if field_info.get('endian', 'little') == 'little':
-                            value = msg.data[byte_indices[0]] | (msg.data[byte_indices[1]] << 8)
-                        else:
-                            value = (msg.data[byte_indices[0]] << 8) | msg.data[byte_indices[1]]
-                        decoded[field_name] = {
-                            'value': value,
-                            'hex': f'0x{value:04X}',
-                            'description': field_info['description']
-                        }
-                
-                elif field_type == '32bit':
-                    byte_indices = field_info['bytes']
-                    if all(idx < len(msg.data) for idx in byte_indices):
-                        if field_info.get('endian', 'little') == 'little':
-                            value = (msg.data[byte_indices[0]] |
-                                     (msg.data[byte_indices[1]] << 8) |
-                                     (msg.data[byte_indices[2]] << 16) |
-                                     (msg.data[byte_indices[3]] << 24))
-                        else:
-                            value = ((msg.data[byte_indices[0]] << 24) |
-                                     (msg.data[byte_indices[1]] << 16) |
-                                     (msg.data[byte_indices[2]] << 8) |
-                                     msg.data[byte_indices[3]])
-                        
-                        result = {
-                            'value': value,
-                            'hex': f'0x{value:08X}',
-                            'description': field_info['description']
-                        }
-                        
-                        # Handle epoch-based timestamp conversion
-                        if 'epoch_base' in field_info:
-                            unix_ts = value + field_info['epoch_base']
-                            try:
-                                dt = datetime.fromtimestamp(unix_ts, tz=timezone.utc)
-                                result['datetime'] = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-                                result['unix_timestamp'] = unix_ts
-                            except (OSError, OverflowError, ValueError):
-                                result['datetime'] = 'Invalid timestamp'
-                                result['unix_timestamp'] = unix_ts
-                        
-                        decoded[field_name] = result
-                
-                elif field_type == '16bit_signed':
-                    byte_indices = field_info['bytes']
-                    if all(idx < len(msg.data) for idx in byte_indices):
-                        if field_info.get('endian', 'little') == 'little':
-                            raw = msg.data[byte_indices[0]] | (msg.data[byte_indices[1]] << 8)
-                        else:
-                            raw = (msg.data[byte_indices[0]] << 8) | msg.data[byte_indices[1]]
-                        # Convert to signed
-                        value = struct.unpack('<h', struct.pack('<H', raw))[0]
-                        result = {
-                            'value': value,
-                            'hex': f'0x{raw:04X}',
-                            'description': field_info['description']
-                        }
-                        if 'status_func' in field_info:
-                            try:
-                                result['status'] = field_info['status_func'](value)
-                            except Exception:
-                                pass
-                        decoded[field_name] = result
-                
-                elif field_type == 'nibble_lower':
-                    byte_idx = field_info['byte']
-                    if len(msg.data) > byte_idx:
-                        value = msg.data[byte_idx] & 0x0F
-                        decoded[field_name] = {
-                            'value': value,
-                            'hex': f'0x{value:X}',
-                            'description': field_info['description']
-                        }
-                        if 'values' in field_info:
-                            decoded[field_name]['text'] = field_info['values'].get(value, 'Unknown')
-                
-                elif field_type == 'nibble_upper':
-                    byte_idx = field_info['byte']
-                    if len(msg.data) > byte_idx:
-                        value = (msg.data[byte_idx] >> 4) & 0x0F
-                        decoded[field_name] = {
-                            'value': value,
-                            'hex': f'0x{value:X}',
-                            'description': field_info['description']
-                        }
-                        if 'values' in field_info:
-                            decoded[field_name]['text'] = field_info['values'].get(value, 'Unknown')
-                
-                elif field_type == 'byte_enum':
-                    byte_idx = field_info['byte']
-                    if len(msg.data) > byte_idx:
-                        value = msg.data[byte_idx]
-                        decoded[field_name] = {
-                            'value': value,
-                            'hex': f'0x{value:02X}',
-                            'description': field_info['description']
-                        }
-                        if 'values' in field_info:
-                            decoded[field_name]['text'] = field_info['values'].get(value, 'Unknown')
-                
-                elif field_type == 'bit_field':
-                    byte_idx = field_info['byte']
-                    bit_pos = field_info.get('bit', 0)
-                    if len(msg.data) > byte_idx:
-                        byte_val = msg.data[byte_idx]
-                        bit_value = (byte_val >> bit_pos) & 0x01
-                        decoded[field_name] = {
-                            'value': bit_value,
-                            'byte_value': byte_val,
-                            'bit_position': bit_pos,
-                            'description': field_info['description']
-                        }
-                        if 'values' in field_info:
-                            decoded[field_name]['text'] = field_info['values'].get(bit_value, 'Unknown')
-                
-            except Exception as e:
-                print(f"    Warning: Failed to decode {field_name}: {e}")
-                continue
-        
-        return decoded
+    def _prepare_decoder(self, decode_info):
+        """Generate a target's special_decode decoder up front instead of on its first match"""
+        if decode_info and 'special_decode' in decode_info:
+            decoder_for(decode_info['special_decode'])
     
     def _print_match_details(self, msg, match_number, decode_info):
-        """Print detailed match information"""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        print(f"\n{'-'*80}")
-        print(f"MATCH #{match_number}")
-        print(f"{'-'*80}")
-        print(f"  Time: {ts}")
-        print(f"  ID:   0x{msg.arbitration_id:X} ({'Ext' if msg.is_extended_id else 'Std'})")
-        print(f"  DLC:  {msg.dlc}")
-        print(f"  Data: {' '.join(f'{b:02X}' for b in msg.data)}")
-        
-        if decode_info and 'data_description' in decode_info and len(msg.data) > 0:
-            print(f"\n  Data Breakdown:")
-            for i, byte_val in enumerate(msg.data):
-                if i in decode_info['data_description']:
-                    print(f"    [{i+1}] 0x{byte_val:02X}: {decode_info['data_description'][i]}")
+        """Print detailed match information (composed into one stdout write)"""
+        ts = self._fmt_ts(msg.timestamp)
+        write = sys.stdout.write
+        payload = msg.data  # bytearray, read in place below
+        
+        lines = [
+            f"\n{'-'*80}",
+            f"MATCH #{match_number}",
+            f"{'-'*80}",
+            f"  Time: {ts}",
+            f"  ID:   0x{msg.arbitration_id:X} ({'Ext' if msg.is_extended_id else 'Std'})",
+            f"  DLC:  {msg.dlc}",
+            f"  Data: {payload.hex(' ').upper()}",
+        ]
+        add = lines.append
+        
+        if decode_info and 'data_description' in decode_info and payload:
+            add(f"\n  Data Breakdown:")
+            descriptions = decode_info['data_description']
+            for i, byte_val in enumerate(payload):
+                if i in descriptions:
+                    add(f"    [{i+1}] 0x{_HEX_LUT[byte_val]}: {descriptions[i]}")
             
-            if 'special_decode' in decode_info:
-                decoded = self._decode_special_fields(msg, decode_info['special_decode'])
+            if decode_info.get('special_decode'):
+                # Decode warnings are printed as they happen: write what comes before them first
+                write('\n'.join(lines) + '\n')
+                lines.clear()
+                decoded = decoder_for(decode_info['special_decode'])(payload)
                 
                 if decoded:
-                    print(f"\n  Decoded Values:")
+                    add(f"\n  Decoded Values:")
                     for field_name, data in decoded.items():
                         desc = data['description']
                         
                         if 'datetime' in data:
                             # Special formatting for timestamps
-                            print(f"    {desc}: {data['value']} (0x{data['value']:08X})")
-                            print(f"      Date/Time: {data['datetime']}")
-                            print(f"      Unix Time: {data['unix_timestamp']}")
+                            add(f"    {desc}: {data['value']} (0x{data['value']:08X})")
+                            add(f"      Date/Time: {data['datetime']}")
+                            add(f"      Unix Time: {data['unix_timestamp']}")
                         elif 'hex' in data and 'text' in data:
-                            print(f"    {desc}: {data['value']} ({data['hex']}) = {data['text']}")
+                            add(f"    {desc}: {data['value']} ({data['hex']}) = {data['text']}")
                         elif 'hex' in data:
-                            print(f"    {desc}: {data['value']} ({data['hex']})")
+                            add(f"    {desc}: {data['value']} ({data['hex']})")
                         elif 'text' in data:
-                            print(f"    {desc}: {data['value']} = {data['text']}")
+                            add(f"    {desc}: {data['value']} = {data['text']}")
                         elif 'status' in data:
-                            print(f"    {desc}: {data['value']} ({data['hex']}) -> {data['status']}")
+                            add(f"    {desc}: {data['value']} ({data['hex']}) -> {data['status']}")
                         elif 'bit_position' in data:
                             text = data.get('text', str(data['value']))
-                            print(f"    {desc}: Bit {data['bit_position']} = {data['value']} ({text})")
-                            print(f"      Full byte: 0x{data['byte_value']:02X} ({data['byte_value']:08b}b)")
+                            add(f"    {desc}: Bit {data['bit_position']} = {data['value']} ({text})")
+                            byte_value = data['byte_value']
+                            add(f"      Full byte: 0x{_HEX_LUT[byte_value]} ({_BIN_LUT[byte_value]}b)")
                         else:
-                            print(f"    {desc}: {data['value']}")
+                            add(f"    {desc}: {data['value']}")
         
         if decode_info and 'notes' in decode_info:
-            print(f"\n  Notes:")
+            add(f"\n  Notes:")
             for note in decode_info['notes']:
-                print(f"    \u2022 {note}")
+                add(f"    \u2022 {note}")
         
-        print(f"{'-'*80}")
+        add(f"{'-'*80}")
+        write('\n'.join(lines) + '\n')
     
     # ==================== HELPER FUNCTIONS ====================
     
-    def _check_match(self, msg, target_id, target_data=None):
-        """Check if a received message matches the target"""
-        if msg.arbitration_id != target_id:
-            return False
-        
-        if target_data is None:
-            return True
-        
-        if len(msg.data) < len(target_data):
-            return False
-        
-        for i, expected in enumerate(target_data):
-            if expected is None:
-                continue  # Wildcard
-            if msg.data[i] != expected:
-                return False
-        
-        return True
+    def _fmt_ts(self, ts):
+        """Format an epoch timestamp as local 'YYYY-MM-DD HH:MM:SS.mmm' (date part cached per second)"""
+        sec = int(ts)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_sec_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        return f"{self._last_sec_str}.{int((ts - sec) * 1000):03d}"
     
     def _print_message(self, msg, match=False):
         """Print a single CAN message (single-target mode)"""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        if msg.is_extended_id:
-            id_str = f"0x{msg.arbitration_id:08X}"
-        else:
-            id_str = f"0x{msg.arbitration_id:03X}"
-        
-        type_str = "Ext" if msg.is_extended_id else "Std"
-        data_str = ' '.join(f'{b:02X}' for b in msg.data)
+        ts = self._fmt_ts(msg.timestamp)
         match_str = "<<< MATCH" if match else ""
-        
-        print(f"{ts:<26} {id_str:<12} {type_str:<6} {msg.dlc:<4} {data_str:<30} {match_str:<10}")
+        sys.stdout.write(_ROW_FMT(ts, _ID_FMT[msg.is_extended_id].format(msg.arbitration_id),
+                                  _ID_TYPE[msg.is_extended_id], msg.dlc, msg.data.hex(' ').upper(), match_str))
     
     def _print_message_multi(self, msg, match=False, match_name=None):
         """Print a single CAN message (multi-target mode)"""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        if msg.is_extended_id:
-            id_str = f"0x{msg.arbitration_id:08X}"
-        else:
-            id_str = f"0x{msg.arbitration_id:03X}"
-        
-        type_str = "Ext" if msg.is_extended_id else "Std"
-        data_str = ' '.join(f'{b:02X}' for b in msg.data)
+        ts = self._fmt_ts(msg.timestamp)
         
         if match and match_name:
             match_str = f"<<< {match_name}"
@@ -826,37 +904,46 @@ class CANTransceiver:
         else:
             match_str = ""
         
-        print(f"{ts:<26} {id_str:<12} {type_str:<6} {msg.dlc:<4} {data_str:<30} {match_str:<15}")
+        sys.stdout.write(_ROW_FMT_MULTI(ts, _ID_FMT[msg.is_extended_id].format(msg.arbitration_id),
+                                        _ID_TYPE[msg.is_extended_id], msg.dlc, msg.data.hex(' ').upper(), match_str))
     
     def _print_message_simple(self, msg):
         """Print a simple CAN message line (monitor mode)"""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        if msg.is_extended_id:
-            id_str = f"0x{msg.arbitration_id:08X}"
-        else:
-            id_str = f"0x{msg.arbitration_id:03X}"
-        
-        type_str = "Ext" if msg.is_extended_id else "Std"
-        data_str = ' '.join(f'{b:02X}' for b in msg.data)
-        
-        print(f"{ts:<26} {id_str:<12} {type_str:<6} {msg.dlc:<4} {data_str:<30}")
+        ts = self._fmt_ts(msg.timestamp)
+        sys.stdout.write(_ROW_FMT_SIMPLE(ts, _ID_FMT[msg.is_extended_id].format(msg.arbitration_id),
+                                         _ID_TYPE[msg.is_extended_id], msg.dlc, msg.data.hex(' ').upper()))
     
     def _format_data_pattern(self, pattern):
         """Format a data pattern for display"""
         if pattern is None:
             return "ANY"
-        parts = []
-        for b in pattern:
-            if b is None:
-                parts.append('XX')
-            else:
-                parts.append(f'{b:02X}')
-        return ' '.join(parts)
+        return format_data_pattern(pattern)
 
 
 # ==================== STANDALONE UTILITY FUNCTIONS ====================
 
+def _msg_name_completer(text, state):
+    """readline completer over predefined message names"""
+    prefix = text.upper()
+    matches = [name for name in _PREDEF_SORTED if name.startswith(prefix)]
+    return matches[state] if state < len(matches) else None
+
+
+def prompt_msg_name():
+    """Ask for a predefined message name, Tab-completing it where readline is available"""
+    if readline is None:
+        return input("Message name: ").strip().upper()
+    
+    readline.set_completer(_msg_name_completer)
+    readline.set_completer_delims(' \t')
+    # macOS ships libedit, which takes a different binding syntax
+    readline.parse_and_bind('bind ^I rl_complete' if 'libedit' in (readline.__doc__ or '') else 'tab: complete')
+    try:
+        return input("Message name (Tab to complete): ").strip().upper()
+    finally:
+        readline.set_completer(None)  # Later data prompts don't complete names
+
+
 def parse_can_id(id_str):
     """Parse a CAN ID string (hex or decimal) to integer"""
     if not id_str:
@@ -871,6 +958,94 @@ def parse_can_id(id_str):
         return None
 
 
+def build_acceptance_filters(targets):
+    """
+    Build python-can acceptance filters for the monitored IDs
+    
+    Args:
+        targets: Iterable of (can_id, extended); extended=None guesses from the ID (> 0x7FF = 29-bit)
+    
+    Returns:
+        list of filter dicts for bus.set_filters()
+    """
+    filters = {}
+    for can_id, extended in targets:
+        if extended is None:
+            extended = can_id > 0x7FF
+        filters[(can_id, extended)] = {
+            'can_id': can_id,
+            'can_mask': 0x1FFFFFFF if extended else 0x7FF,
+            'extended': extended,
+        }
+    return list(filters.values())
+
+
+def compile_matcher(target_data):
+    """
+    Generate a match(data) -> bool function for a data pattern, None if any data
+    matches. The expected bytes are baked in as constants: single bytes become
+    index compares, runs of 3+ fixed bytes one slice compare against a bytes literal.
+    A pattern without wildcards is a single prefix compare (short data can't equal it)
+    """
+    if target_data is None:
+        return None
+    if all(type(b) is int and 0 <= b <= 0xFF for b in target_data):
+        namespace = {}
+        exec(f"def _match(data):\n    return data[:{len(target_data)}] == {bytes(target_data)!r}\n", namespace)
+        return namespace['_match']
+    terms = [f'len(data) >= {len(target_data)}']
+    i = 0
+    while i < len(target_data):
+        if target_data[i] is None:
+            i += 1  # Wildcard
+            continue
+        end = i
+        while end < len(target_data) and target_data[end] is not None:
+            end += 1
+        run = target_data[i:end]
+        if len(run) >= 3 and all(type(b) is int and 0 <= b <= 0xFF for b in run):
+            terms.append(f'data[{i}:{end}] == {bytes(run)!r}')
+        else:
+            terms.extend(f'data[{j}] == {target_data[j]!r}' for j in range(i, end))
+        i = end
+    namespace = {}
+    exec(f"def _match(data):\n    return {' and '.join(terms)}\n", namespace)
+    return namespace['_match']
+
+
+def build_listen_targets(msg_names):
+    """Build listen targets for predefined messages, matchers generated up front"""
+    targets = []
+    for msg_name in msg_names:
+        msg_def = _PREDEF_UPPER[msg_name]
+        targets.append({
+            'id': msg_def['id'],
+            'data': msg_def.get('data_pattern'),
+            'decode_info': msg_def,
+            'name': msg_name,
+            '_match': compile_matcher(msg_def.get('data_pattern')),
+        })
+    return targets
+
+
+def format_data_pattern(pattern):
+    """Format a data pattern as 'AA XX BB' hex, one bytes.hex() call when it has no wildcards"""
+    if None not in pattern:
+        return bytes(pattern).hex(' ').upper()
+    return ' '.join('XX' if b is None else _HEX_LUT[b] for b in pattern)
+
+
+def hex_tokens_to_bytes(tokens):
+    """Decode 1-2 digit hex tokens, 0x prefix optional, with a single bytes.fromhex (None if any token doesn't fit)"""
+    tokens = [token[2:] if token[:2] in ('0x', '0X') else token for token in tokens]
+    if not all(0 < len(token) <= 2 for token in tokens):
+        return None
+    try:
+        return bytes.fromhex(''.join(token.zfill(2) for token in tokens))
+    except ValueError:
+        return None
+
+
 def list_predefined_messages():
     """List all predefined CAN messages"""
     print("\n" + "=" * 80)
@@ -883,21 +1058,18 @@ def list_predefined_messages():
         print("=" * 80 + "\n")
         return
     
-    for name, config in sorted(PREDEFINED_MESSAGES.items()):
+    for name in _PREDEF_SORTED:
+        config = PREDEFINED_MESSAGES[name]
         can_id = config['id']
         is_ext = config.get('extended', True)
-        id_format = "0x{:08X}" if is_ext else "0x{:03X}"
         desc = config.get('description', 'N/A')
         
         print(f"\n  {name}")
         print(f"    Description: {desc}")
-        print(f"    CAN ID:      {id_format.format(can_id)} ({'Extended' if is_ext else 'Standard'})")
+        print(f"    CAN ID:      {_ID_FMT[is_ext].format(can_id)} ({'Extended' if is_ext else 'Standard'})")
         
         if 'data_pattern' in config and config['data_pattern'] is not None:
-            pattern_str = ' '.join(
-                'XX' if b is None else f'{b:02X}' for b in config['data_pattern']
-            )
-            print(f"    Data Match:  {pattern_str}")
+            print(f"    Data Match:  {format_data_pattern(config['data_pattern'])}")
         else:
             print(f"    Data Match:  ANY")
         
@@ -956,14 +1128,37 @@ def diagnose_pcan():
     # Check config
     print(f"\n3. Message configuration:")
     print(f"   Messages defined: {len(PREDEFINED_MESSAGES)}")
-    for name in sorted(PREDEFINED_MESSAGES.keys()):
+    for name in _PREDEF_SORTED:
         print(f"   \u2022 {name}")
     
     print("\n" + "=" * 70 + "\n")
 
 
-def parse_receiver_style_arguments():
-    """Parse pcan_receiver.py style arguments (MSG=, ID=, DATA=, TIMEOUT=)"""
+@functools.lru_cache(maxsize=256)
+def _upper(name):
+    """Upper-case a message name, memoized so repeated names share one string"""
+    return name.upper()
+
+
+def tokenize_argv(argv):
+    """Tag each argument once as ('kv', KEY, value), ('flag', arg, None) or ('value', None, arg)"""
+    tokens = []
+    for arg in argv:
+        # One regex match splits KEY=value (case-insensitive key, value untouched)
+        kv = RECEIVER_KV_RE.match(arg)
+        if kv:
+            tokens.append(('kv', kv.group(1).upper(), kv.group(2)))
+        elif arg.startswith('-'):
+            tokens.append(('flag', arg, None))
+        else:
+            tokens.append(('value', None, arg))
+    return tokens
+
+
+def parse_receiver_style_arguments(tokens=None):
+    """Parse pcan_receiver.py style arguments (MSG=, ID=, DATA=, TIMEOUT=) from tokenize_argv() tokens"""
+    if tokens is None:
+        tokens = tokenize_argv(sys.argv[1:])
     target_id = None
     target_data = None
     monitor_mode = False
@@ -972,38 +1167,47 @@ def parse_receiver_style_arguments():
     collect_all = True
     quiet_mode = False
     
-    for arg in sys.argv[1:]:
-        if arg in ['--monitor', '-m']:
+    for kind, key, value in tokens:
+        # Flags carry the raw argument as their key, KEY=value tokens the upper-cased key
+        if key in ['--monitor', '-m']:
             monitor_mode = True
-        elif arg in ['--list', '-l']:
+        elif key in ['--list', '-l']:
             list_predefined_messages()
             sys.exit(0)
-        elif arg in ['--first', '-f']:
+        elif key in ['--first', '-f']:
             collect_all = False
-        elif arg in ['--all', '-a']:
+        elif key in ['--all', '-a']:
             collect_all = True
-        elif arg in ['--quiet', '-q']:
+        elif key in ['--quiet', '-q']:
             quiet_mode = True
-        elif arg in ['--verbose', '-v']:
+        elif key in ['--verbose', '-v']:
             quiet_mode = False
-        elif arg.upper().startswith('MSG='):
-            msg_names = arg.split('=', 1)[1].upper()
-            for msg_name in msg_names.split(','):
-                msg_name = msg_name.strip()
-                if msg_name in PREDEFINED_MESSAGES:
+        elif key == 'MSG':
+            for msg_name in value.split(','):
+                msg_name = _upper(msg_name.strip())
+                if msg_name in _PREDEF_UPPER:
                     predefined_list.append(msg_name)
                 else:
                     print(f"\u2717 Unknown: {msg_name}")
                     sys.exit(1)
-        elif arg.upper().startswith('ID='):
-            id_str = arg.split('=', 1)[1]
+        elif key == 'ID':
+            id_str = value
             try:
                 target_id = int(id_str, 16) if id_str.startswith('0x') else int(id_str, 0)
             except ValueError:
                 print(f"\u2717 Invalid ID: {id_str}")
                 sys.exit(1)
-        elif arg.upper().startswith('DATA='):
-            data_str = arg.split('=', 1)[1]
+        elif key == 'DATA':
+            data_str = value
+            byte_tokens = [byte_str.strip() for byte_str in data_str.split(',')]
+            wild = [token.upper() in ['X', 'XX', '*', '?'] for token in byte_tokens]
+            
+            # Fast path: decode the whole pattern at once, wildcards as 00 placeholders
+            values = hex_tokens_to_bytes(['00' if w else token for token, w in zip(byte_tokens, wild)])
+            if values is not None:
+                target_data = [None if w else v for v, w in zip(values, wild)]
+                continue
+            
             try:
                 target_data = []
                 for byte_str in data_str.split(','):
@@ -1018,9 +1222,9 @@ def parse_receiver_style_arguments():
             except ValueError as e:
                 print(f"\u2717 Invalid DATA: {e}")
                 sys.exit(1)
-        elif arg.upper().startswith('TIMEOUT='):
+        elif key == 'TIMEOUT':
             try:
-                timeout = float(arg.split('=', 1)[1])
+                timeout = float(value)
                 if timeout < 0:
                     raise ValueError()
             except ValueError:
@@ -1031,20 +1235,23 @@ def parse_receiver_style_arguments():
 
 
 def main():
+    # Frame rows are flushed in batches by CANTransceiver._receive(), not per line
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
+    # Tokenize once; both the receiver-style check and its parser work from these tokens
+    argv = sys.argv[1:]
+    tokens = tokenize_argv(argv)
+    flags = [key for kind, key, _ in tokens if kind == 'flag']
+    
     # Check for receiver-style arguments (MSG=, ID=, DATA=)
-    receiver_style = False
-    for arg in sys.argv[1:]:
-        if arg.upper().startswith(('MSG=', 'ID=', 'DATA=', 'TIMEOUT=')):
-            receiver_style = True
-            break
-        if arg in ['--monitor', '-m'] and '--send' not in sys.argv and '--interactive' not in sys.argv:
-            # Only treat as receiver-style if not combined with send/interactive flags
-            if not any(a.startswith('--') and a not in ['--monitor', '-m', '--quiet', '-q', '--first', '-f', '--all', '-a', '--verbose', '-v', '--list', '-l'] for a in sys.argv[1:]):
-                receiver_style = True
-                break
+    receiver_style = any(kind == 'kv' for kind, _, _ in tokens)
+    if not receiver_style and ('--monitor' in flags or '-m' in flags) and '--send' not in flags and '--interactive' not in flags:
+        # Only treat as receiver-style if not combined with send/interactive flags
+        receiver_style = not any(flag.startswith('--') and flag not in RECEIVER_FLAGS for flag in flags)
     
     if receiver_style:
-        monitor_mode, target_id, target_data, timeout, predefined_list, collect_all, quiet_mode = parse_receiver_style_arguments()
+        monitor_mode, target_id, target_data, timeout, predefined_list, collect_all, quiet_mode = parse_receiver_style_arguments(tokens)
         
         transceiver = CANTransceiver(
             interface=CAN_CONFIG['interface'],
@@ -1056,15 +1263,7 @@ def main():
             if monitor_mode:
                 transceiver.monitor_all(duration=timeout)
             elif predefined_list:
-                targets = []
-                for msg_name in predefined_list:
-                    msg_def = PREDEFINED_MESSAGES[msg_name]
-                    targets.append({
-                        'id': msg_def['id'],
-                        'data': msg_def.get('data_pattern'),
-                        'decode_info': msg_def,
-                        'name': msg_name
-                    })
+                targets = build_listen_targets(predefined_list)
                 
                 if len(targets) == 1:
                     found = transceiver.wait_for_message(
@@ -1106,10 +1305,12 @@ Examples:
   python pcan_transceiver.py --send --msg CURRENT_DATETIME_CONNECTIVITY --now
   python pcan_transceiver.py --send --msg CURRENT_DATETIME_CONNECTIVITY --datetime "2026-02-03 07:00:00"
   python pcan_transceiver.py --send --id 0x123 --data "01 02 03"
+  python pcan_transceiver.py --send --id 0x123 --data "01 02 03" --count 100 --period 0.01
   
   # INTERACTIVE MODE
   python pcan_transceiver.py --interactive --msg BI_RESULTS
   python pcan_transceiver.py --interactive --id 0x100
+  python pcan_transceiver.py --interactive    (prompts for the name; Tab completes)
   
   # MONITOR MODE
   python pcan_transceiver.py --monitor
@@ -1152,6 +1353,10 @@ Examples:
                        help='Timestamp for FC 08 messages')
     parser.add_argument('--datetime', type=str,
                        help='Date/time string "YYYY-MM-DD HH:MM:SS" (for FC 08)')
+    parser.add_argument('--count', type=int, default=1,
+                       help='Number of times to send the message (default: 1)')
+    parser.add_argument('--period', type=float, default=0,
+                       help='Seconds between repeated sends (0=back to back)')
     
     # Listen mode options
     parser.add_argument('--quiet', '-q', action='store_true',
@@ -1167,7 +1372,7 @@ Examples:
     parser.add_argument('--bitrate', type=int, default=250000,
                        help='CAN bitrate (default: 250000)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Handle --list
     if args.list:
@@ -1190,23 +1395,15 @@ Examples:
         # Listen mode
         if args.listen:
             # Support both "MSG=NAME" and plain "NAME" formats
-            listen_value = args.listen
-            if '=' in listen_value:
-                listen_value = listen_value.split('=', 1)[1]
+            _, sep, value = args.listen.partition('=')
+            listen_value = value if sep else args.listen
             
-            msg_names = [name.strip().upper() for name in listen_value.split(',')]
-            targets = []
+            msg_names = [_upper(name.strip()) for name in listen_value.split(',')]
             for msg_name in msg_names:
-                if msg_name not in PREDEFINED_MESSAGES:
+                if msg_name not in _PREDEF_UPPER:
                     print(f"\u2717 Unknown message: {msg_name}")
                     sys.exit(1)
-                msg_def = PREDEFINED_MESSAGES[msg_name]
-                targets.append({
-                    'id': msg_def['id'],
-                    'data': msg_def.get('data_pattern'),
-                    'decode_info': msg_def,
-                    'name': msg_name
-                })
+            targets = build_listen_targets(msg_names)
             
             collect_all = not args.first
             if len(targets) == 1:
@@ -1227,14 +1424,16 @@ Examples:
             if not args.msg and not args.id:
                 print("\u2717 Error: --msg or --id required in send mode")
                 sys.exit(1)
+            if args.count < 1 or args.period < 0:
+                print("\u2717 Error: --count must be at least 1 and --period non-negative")
+                sys.exit(1)
             
             # Handle datetime to timestamp conversion
             timestamp = None
             if args.datetime:
                 try:
                     dt = datetime.strptime(args.datetime, "%Y-%m-%d %H:%M:%S")
-                    epoch_1970 = datetime(1970, 1, 1)
-                    unix_timestamp = int((dt - epoch_1970).total_seconds())
+                    unix_timestamp = int(dt.replace(tzinfo=timezone.utc).timestamp())
                     timestamp = unix_timestamp - EPOCH_BASE
                     
                     print(f"Input datetime:     {args.datetime} (treated as UTC)")
@@ -1256,10 +1455,12 @@ Examples:
             
             if args.msg:
                 success = transceiver.send_predefined_message(
-                    args.msg.upper(),
+                    _upper(args.msg),
                     data=data,
                     timestamp=timestamp,
-                    use_now=args.now
+                    use_now=args.now,
+                    count=args.count,
+                    period=args.period
                 )
             else:
                 can_id = parse_can_id(args.id)
@@ -1276,14 +1477,14 @@ Examples:
                 elif not args.extended:
                     is_extended = (can_id > 0x7FF)
                 
-                success = transceiver.send_message(can_id, data, is_extended)
+                success = transceiver.send_message(can_id, data, is_extended, count=args.count, period=args.period)
             
             sys.exit(0 if success else 1)
         
         # Interactive mode
         elif args.interactive:
             if args.msg:
-                success = transceiver.interactive_send(msg_name=args.msg.upper())
+                success = transceiver.interactive_send(msg_name=_upper(args.msg))
             elif args.id:
                 can_id = parse_can_id(args.id)
                 if can_id is None:
@@ -1298,8 +1499,7 @@ Examples:
                 
                 success = transceiver.interactive_send(can_id=can_id, is_extended=is_extended)
             else:
-                print("\u2717 Error: --msg or --id required in interactive mode")
-                sys.exit(1)
+                success = transceiver.interactive_send()
             
             sys.exit(0 if success else 1)
         